@@ -312,7 +312,7 @@ async def start_server(
         connection_id = f"{peer[0]}:{peer[1]}" if peer else str(id(ws))
 
         # Check connection limit before proceeding
-        if not connection_limiter.add_connection(connection_id):
+        if not await connection_limiter.add_connection_async(connection_id):
             log(f"[server] rejecting connection from {peer}: connection limit reached")
             await ws.close(code=1008, reason="Connection limit reached")
             return
@@ -333,7 +333,7 @@ async def start_server(
             if "ConnectionClosed" not in str(type(e)):
                 log(f"[server] client session error: {peer} - {e}")
         finally:
-            connection_limiter.remove_connection(connection_id)
+            await connection_limiter.remove_connection_async(connection_id)
             active_count = connection_limiter.get_active_count()
             max_conn = server_config.max_connections
             log(f"[server] client disconnected: {peer} (active: {active_count}/{max_conn})")
@@ -6,6 +6,8 @@ to enhance security and prevent resource exhaustion attacks.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import threading
 from dataclasses import dataclass
 
@@ -54,8 +56,23 @@ class ServerConfig:
             log.info(f"Server binding to specific address: {self.bind_address}")
 
 
+def _connection_key(connection_id: str) -> int:
+    """Return a compact 64-bit integer key for a connection ID.
+
+    Tracking ints instead of the ID strings keeps the per-entry footprint small
+    and makes membership checks a plain integer comparison.
+    """
+    digest = hashlib.blake2b(connection_id.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
 class ConnectionLimiter:
-    """Thread-safe connection limiter to prevent resource exhaustion."""
+    """Thread-safe connection limiter to prevent resource exhaustion.
+
+    The synchronous methods may be called from any thread. Coroutines should
+    prefer ``add_connection_async``/``remove_connection_async``, which admit
+    connections through an ``asyncio.Semaphore`` and never block the loop.
+    """
 
     def __init__(self, max_connections: int = 10):
         """Initialize the connection limiter.
@@ -66,7 +83,10 @@ class ConnectionLimiter:
         self.max_connections = max_connections
         self.active_connections = 0
         self._lock = threading.Lock()
-        self._connection_ids = set()
+        # 64-bit keys derived from connection IDs (see _connection_key)
+        self._connection_ids: set[int] = set()
+        # Admission slots for the async API, created lazily on the running loop
+        self._async_slots: asyncio.Semaphore | None = None
 
     def can_accept_connection(self) -> bool:
         """Check if a new connection can be accepted.
@@ -86,35 +106,90 @@ class ConnectionLimiter:
         Returns:
             True if connection was added, False if limit reached
         """
+        return self._register(_connection_key(connection_id), connection_id)
+
+    def _register(self, key: int, connection_id: str) -> bool:
+        """Record a connection under the lock; shared by the sync and async APIs."""
         with self._lock:
             if self.active_connections >= self.max_connections:
                 log.warning(f"Connection limit reached ({self.max_connections}), rejecting connection {connection_id}")
                 return False
 
-            if connection_id in self._connection_ids:
+            if key in self._connection_ids:
                 log.warning(f"Duplicate connection ID: {connection_id}")
                 return False
 
             self.active_connections += 1
-            self._connection_ids.add(connection_id)
+            self._connection_ids.add(key)
             log.debug(f"Connection added: {connection_id} (active: {self.active_connections}/{self.max_connections})")
             return True
 
-    def remove_connection(self, connection_id: str) -> None:
+    def remove_connection(self, connection_id: str) -> bool:
         """Remove a connection from tracking.
 
         Args:
             connection_id: Unique identifier for the connection
+
+        Returns:
+            True if the connection was tracked and removed, False otherwise
         """
+        key = _connection_key(connection_id)
         with self._lock:
-            if connection_id in self._connection_ids:
+            if key in self._connection_ids:
                 self.active_connections -= 1
-                self._connection_ids.remove(connection_id)
+                self._connection_ids.remove(key)
                 active = self.active_connections
                 max_conn = self.max_connections
                 log.debug(f"Connection removed: {connection_id} (active: {active}/{max_conn})")
-            else:
-                log.warning(f"Attempted to remove unknown connection: {connection_id}")
+                return True
+            log.warning(f"Attempted to remove unknown connection: {connection_id}")
+            return False
+
+    def _slots(self) -> asyncio.Semaphore:
+        """Return the admission semaphore, creating it on first use inside the loop."""
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(self.max_connections)
+        return self._async_slots
+
+    async def add_connection_async(self, connection_id: str, timeout: float | None = 0) -> bool:
+        """Register a connection from a coroutine without blocking the event loop.
+
+        Args:
+            connection_id: Unique identifier for the connection
+            timeout: Seconds to wait for a free slot; 0 rejects immediately
+                (same behavior as ``add_connection``), None waits indefinitely
+
+        Returns:
+            True if connection was added, False if no slot became available
+            or the ID is already tracked
+        """
+        slots = self._slots()
+        if timeout == 0:
+            if slots.locked():
+                log.warning(f"Connection limit reached ({self.max_connections}), rejecting connection {connection_id}")
+                return False
+            # A free slot is acquired without suspending
+            await slots.acquire()
+        else:
+            try:
+                await asyncio.wait_for(slots.acquire(), timeout)
+            except asyncio.TimeoutError:
+                log.warning(f"Timed out waiting for a connection slot for {connection_id}")
+                return False
+        # Bookkeeping never awaits, so the thread lock is only held briefly
+        if self._register(_connection_key(connection_id), connection_id):
+            return True
+        slots.release()
+        return False
+
+    async def remove_connection_async(self, connection_id: str) -> None:
+        """Remove a connection registered with ``add_connection_async`` and free its slot.
+
+        Args:
+            connection_id: Unique identifier for the connection
+        """
+        if self.remove_connection(connection_id) and self._async_slots is not None:
+            self._async_slots.release()
 
     def get_active_count(self) -> int:
         """Get the current number of active connections.
@@ -130,6 +205,7 @@ class ConnectionLimiter:
         with self._lock:
             self.active_connections = 0
             self._connection_ids.clear()
+            self._async_slots = None
             log.info("Connection limiter reset")
 
 
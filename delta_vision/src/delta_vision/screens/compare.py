@@ -12,8 +12,11 @@ from __future__ import annotations
 
 import os
 import re
-from dataclasses import dataclass
+import stat
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from rich.text import Text
@@ -22,7 +25,7 @@ from textual.containers import Vertical
 from textual.widgets import DataTable
 
 from delta_vision.utils.base_screen import BaseTableScreen
-from delta_vision.utils.io import read_lines
+from delta_vision.utils.io import DEFAULT_ENCODINGS, read_lines
 from delta_vision.utils.logger import log
 from delta_vision.utils.screen_navigation import create_navigator
 from delta_vision.utils.table_navigation import TableNavigationHandler
@@ -30,6 +33,28 @@ from delta_vision.utils.watchdog import start_observer
 from delta_vision.widgets.footer import Footer
 
 
+@lru_cache(maxsize=256)
+def _cached_read_lines(path: str, mtime_ns: int, size: int) -> tuple[list[str], str]:
+    """Memoized ``read_lines``; the stat signature in the key invalidates stale entries.
+
+    The returned list is shared between callers and must not be mutated.
+    """
+    return read_lines(path)
+
+
+def _read_lines_cached(path: str, st: os.stat_result | None = None) -> tuple[list[str], str]:
+    """Read lines through the LRU, falling back to a plain read if stat fails.
+
+    Callers that already hold the file's stat result can pass it to skip a stat.
+    """
+    if st is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return read_lines(path)
+    return _cached_read_lines(path, st.st_mtime_ns, st.st_size)
+
+
 @dataclass
 class Pair:
     """A comparison pair between two files for the same command.
@@ -45,6 +70,43 @@ class Pair:
     kind: str  # "DIFF" or "SAME"
 
 
+@dataclass
+class PairTable:
+    """Columnar storage for comparison pairs.
+
+    Each field of every pair lives in its own parallel list so that sort and
+    filter passes read from contiguous columns instead of chasing one object
+    per row. Individual rows are materialized as ``Pair`` on access.
+    """
+
+    commands: list[str] = field(default_factory=list)
+    new_paths: list[str] = field(default_factory=list)
+    old_paths: list[str] = field(default_factory=list)
+    kinds: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def __getitem__(self, index: int) -> Pair:
+        return Pair(self.commands[index], self.new_paths[index], self.old_paths[index], self.kinds[index])
+
+    def append(self, command: str, new_path: str, old_path: str, kind: str) -> None:
+        """Append one pair across all columns."""
+        self.commands.append(command)
+        self.new_paths.append(new_path)
+        self.old_paths.append(old_path)
+        self.kinds.append(kind)
+
+    def reorder(self, order: list[int]) -> PairTable:
+        """Return a new table with rows permuted by the given index order."""
+        return PairTable(
+            commands=[self.commands[i] for i in order],
+            new_paths=[self.new_paths[i] for i in order],
+            old_paths=[self.old_paths[i] for i in order],
+            kinds=[self.kinds[i] for i in order],
+        )
+
+
 class CompareScreen(BaseTableScreen):
     """Table of comparison pairs with quick filtering and navigation."""
 
@@ -69,13 +131,19 @@ class CompareScreen(BaseTableScreen):
         self.old_folder_path = old_folder_path
         self.keywords_path = keywords_path
         self._table = None
-        self._pairs = []  # full computed pairs
+        self._pairs = PairTable()  # full computed pairs (columnar)
         self._display_pairs = []  # pairs actually displayed in the table order
         # Filter toggle (only show rows with changes)
         self._changes_only = False
+        # Change-detection results keyed by both files' path and stat signature
+        self._changed_cache: dict[tuple, bool] = {}
         # Watchdog observers
         self._observer_new = None
         self._observer_old = None
+        # Pending coalesced rescan shared by both folder watchers
+        self._refresh_timer = None
+        # Scratch buffer reused for every header read during a scan
+        self._header_buf = bytearray(4096)
 
         # Table navigation handler
         self._navigation = TableNavigationHandler()
@@ -111,10 +179,10 @@ class CompareScreen(BaseTableScreen):
         await super().on_mount()  # This handles table setup and title
         self._scan_and_populate()
 
-        # Start watchers for live updates
+        # Start watchers for live updates; events from both folders funnel into one rescan
         def trigger_refresh():
             if self.app:
-                self.app.call_later(self._scan_and_populate)
+                self.app.call_later(self._request_refresh)
 
         try:
             if self.new_folder_path and os.path.isdir(self.new_folder_path):
@@ -131,8 +199,34 @@ class CompareScreen(BaseTableScreen):
             self._observer_old = None
             self._stop_old = None
 
+    def _request_refresh(self) -> None:
+        """Schedule a rescan, coalescing bursts of events from NEW and OLD.
+
+        While a rescan is pending, further requests are absorbed by it. The
+        rescan itself runs synchronously on the event loop, so the pending
+        timer is the only in-flight state that needs tracking.
+        """
+        if self._refresh_timer is not None:
+            return
+        try:
+            self._refresh_timer = self.set_timer(0.2, self._run_pending_refresh)
+        except (AttributeError, RuntimeError) as e:
+            log(f"Failed to schedule compare refresh, rescanning now: {e}")
+            self._scan_and_populate()
+
+    def _run_pending_refresh(self) -> None:
+        """Run the coalesced rescan scheduled by ``_request_refresh``."""
+        self._refresh_timer = None
+        self._scan_and_populate()
+
     def on_unmount(self) -> None:
         """Stop any active observers when leaving the screen."""
+        if self._refresh_timer is not None:
+            try:
+                self._refresh_timer.stop()
+            except (AttributeError, RuntimeError) as e:
+                log(f"Failed to cancel pending compare refresh: {e}")
+            self._refresh_timer = None
         # Stop observers when leaving the screen
         # Prefer unified stop functions
         try:
@@ -210,16 +304,19 @@ class CompareScreen(BaseTableScreen):
             log(f"Failed to clear comparison table: {e}")
             pass
 
-    def _process_and_add_pairs(self, table, pairs) -> list[Pair]:
+    def _process_and_add_pairs(self, table, pairs: PairTable) -> list[Pair]:
         """Process pairs, add rows to table with styling and filtering."""
         display_pairs = []
-        for p in pairs:
+        # Only entries for the current pairs survive into the next rescan
+        prev_cache, self._changed_cache = self._changed_cache, {}
+        for i in range(len(pairs)):
+            p = pairs[i]
             cmd_text = Text(p.command, style="bold")
             type_text = Text(p.kind, style=self._type_style(p.kind), justify="center")
 
             # Compute change by comparing file contents (excluding header line)
             try:
-                changed = self._pair_changed(p)
+                changed = self._pair_changed_cached(p, prev_cache)
             except (OSError, UnicodeError) as e:
                 log(f"Failed to determine if files changed for pair {p.command}: {e}")
                 changed = False
@@ -357,59 +454,80 @@ class CompareScreen(BaseTableScreen):
 
     # Note: filenames are intentionally not shown in the table per request.
 
-    def _pair_changed(self, p: Pair) -> bool:
-        """Return True if the compared files differ in content (excluding header)."""
-        a, b = None, None
-        if p.kind == "DIFF":
-            a, b = p.old_path, p.new_path
-        else:  # SAME compares two most-recent NEW files already stored in pair
-            a, b = p.old_path, p.new_path
-        if not a or not b or not os.path.isfile(a) or not os.path.isfile(b):
+    def _pair_changed_cached(self, p: Pair, prev_cache: dict[tuple, bool]) -> bool:
+        """Return ``_pair_changed(p)``, reusing the previous result while both files are untouched."""
+        try:
+            sa, sb = os.stat(p.old_path), os.stat(p.new_path)
+        except (OSError, TypeError, ValueError):
+            return False
+        key = (p.old_path, p.new_path, sa.st_mtime_ns, sa.st_size, sb.st_mtime_ns, sb.st_size)
+        changed = prev_cache.get(key)
+        if changed is None:
+            changed = self._pair_changed(p, (sa, sb))
+        self._changed_cache[key] = changed
+        return changed
+
+    def _pair_changed(self, p: Pair, stats: tuple[os.stat_result, os.stat_result] | None = None) -> bool:
+        """Return True if the compared files differ in content (excluding header).
+
+        ``stats`` lets callers that already stat'ed both files reuse the results;
+        each file is otherwise stat'ed exactly once for the type, size, and mtime
+        checks and for the read cache key.
+        """
+        # DIFF and SAME pairs both compare old_path (older) against new_path (latest)
+        a, b = p.old_path, p.new_path
+        if not a or not b:
             return False
         try:
-            # Fast-path: if sizes and mtimes are identical, assume unchanged
-            sa, sb = os.stat(a), os.stat(b)
+            sa, sb = stats if stats is not None else (os.stat(a), os.stat(b))
+            if not (stat.S_ISREG(sa.st_mode) and stat.S_ISREG(sb.st_mode)):
+                return False
+            # Fast-path: if sizes and mtimes are identical, assume unchanged.
+            # A size mismatch alone is not conclusive: the header line is excluded
+            # and line endings are normalized by splitlines().
             if sa.st_size == sb.st_size and int(sa.st_mtime) == int(sb.st_mtime):
                 return False
-            la = self._read_content_lines(a)
-            lb = self._read_content_lines(b)
+            la = self._read_content_lines(a, sa)
+            lb = self._read_content_lines(b, sb)
             return la != lb
         except (OSError, UnicodeError, ValueError) as e:
             log(f"Failed to compare files {a} and {b}: {e}")
             return False
 
-    def _read_content_lines(self, file_path: str) -> list[str]:
+    def _read_content_lines(self, file_path: str, st: os.stat_result | None = None) -> list[str]:
         """Read file as list of lines, skipping the first line (header)."""
-        lines, _enc = read_lines(file_path)
+        lines, _enc = _read_lines_cached(file_path, st)
         return lines[1:] if lines else []
 
-    def _find_pairs(self) -> list[Pair]:
+    def _find_pairs(self) -> PairTable:
         """Compute DIFF and SAME pairs for all discovered commands."""
         # Build maps of command -> list of file paths for NEW and OLD
         new_map = self._scan_folder(self.new_folder_path)
         old_map = self._scan_folder(self.old_folder_path)
 
-        items: list[Pair] = []
+        items = PairTable()
 
         # DIFF rows: exists in both NEW and OLD; pick latest of each
         for cmd in sorted(set(new_map.keys()) & set(old_map.keys()), key=str.lower):
             new_path = max(new_map[cmd], key=self._safe_mtime)
             old_path = max(old_map[cmd], key=self._safe_mtime)
-            items.append(Pair(cmd, new_path, old_path, kind="DIFF"))
+            items.append(cmd, new_path, old_path, "DIFF")
 
         # SAME rows: command appears multiple times in NEW; compare most recent vs second most recent
         for cmd, files in new_map.items():
             if len(files) >= 2:
                 latest_two = sorted(files, key=self._safe_mtime, reverse=True)[:2]
-                items.append(Pair(cmd, latest_two[0], latest_two[1], kind="SAME"))
-
-        # Sort by command, then by kind (DIFF before SAME), then by newest filename
-        def sort_key(p: Pair):
-            kind_order = 0 if p.kind == "DIFF" else 1
-            return (p.command.lower(), kind_order, os.path.basename(p.new_path).lower())
-
-        items.sort(key=sort_key)
-        return items
+                items.append(cmd, latest_two[0], latest_two[1], "SAME")
+
+        # Sort by command, then by kind (DIFF before SAME), then by newest filename.
+        # Keys are decorated once per row from the columns, then the index
+        # permutation is applied to every column at once.
+        keys = [
+            (cmd.lower(), 0 if kind == "DIFF" else 1, os.path.basename(new_path).lower())
+            for cmd, kind, new_path in zip(items.commands, items.kinds, items.new_paths)
+        ]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        return items.reorder(order)
 
     def _safe_mtime(self, path: str) -> float:
         try:
@@ -420,28 +538,82 @@ class CompareScreen(BaseTableScreen):
 
     def _scan_folder(self, base: str | None) -> dict[str, list[str]]:
         """Return mapping of command -> file paths found under base (recursive)."""
-        result: dict[str, list[str]] = {}
         if not base or not os.path.isdir(base):
-            return result
-        for root, _dirs, files in os.walk(base):
-            for name in files:
-                fp = os.path.join(root, name)
-                if not os.path.isfile(fp):
-                    continue
-                # Extract command between quotes on first line
-                cmd = self._first_line_command(fp)
-                if not cmd:
+            return {}
+        result: defaultdict[str, list[str]] = defaultdict(list)
+        for fp in self._iter_files(base):
+            # Extract command between quotes on first line
+            cmd = self._first_line_command(fp)
+            if not cmd:
+                continue
+            result[cmd].append(fp)
+        # Plain dict so later lookups of unknown commands cannot insert keys
+        return dict(result)
+
+    def _iter_files(self, base: str):
+        """Yield regular file paths under base, walking with ``os.scandir``.
+
+        DirEntry caches the file type from the directory listing, so no extra
+        stat is issued per file. Like ``os.walk``, symlinked directories are
+        not descended into and unreadable directories are skipped.
+        """
+        stack = [base]
+        while stack:
+            folder = stack.pop()
+            try:
+                with os.scandir(folder) as it:
+                    entries = list(it)
+            except OSError as e:
+                log(f"Failed to scan folder {folder}: {e}")
+                continue
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+                except OSError:
                     continue
-                result.setdefault(cmd, []).append(fp)
-        return result
+            # Visit subfolders in listing order (stack is LIFO)
+            stack.extend(reversed(subdirs))
 
     def _first_line_command(self, file_path: str) -> str | None:
         """Extract the quoted command from the header line, if present."""
-        # Centralized multi-encoding read
-        lines, _enc = read_lines(file_path)
-        if not lines:
-            return None
-        return self._extract_command(lines[0])
+        header = self._read_header_line(file_path)
+        if header is None:
+            # Header longer than the scratch buffer: centralized multi-encoding read
+            lines, _enc = _read_lines_cached(file_path)
+            header = lines[0] if lines else ""
+        return self._extract_command(header)
+
+    def _read_header_line(self, file_path: str) -> str | None:
+        """Return the first line decoded from a bounded read into ``_header_buf``.
+
+        Returns "" for empty or unreadable files and None when the first line
+        does not fit in the buffer. Decoding follows the same encoding order as
+        ``read_lines``.
+        """
+        view = memoryview(self._header_buf)
+        try:
+            with open(file_path, "rb", buffering=0) as f:
+                n = f.readinto(view) or 0
+        except OSError as e:
+            log(f"Failed to read header from {file_path}: {e}")
+            return ""
+        data = view[:n].tobytes()
+        end = data.find(b"\n")
+        if end < 0:
+            if n == len(view):
+                return None
+            end = n
+        raw = data[:end].split(b"\r", 1)[0]
+        for enc in DEFAULT_ENCODINGS:
+            try:
+                return raw.decode(enc)
+            except UnicodeDecodeError:
+                continue
+        return raw.decode(DEFAULT_ENCODINGS[-1], errors="ignore")
 
     def _extract_command(self, line: str) -> str | None:
         """Return text between first and last quotes in a header line."""
@@ -9,28 +9,227 @@ ignoring each file's first line (treated as a header). It supports:
 
 from __future__ import annotations
 
-import math
 import os
 import re
-from difflib import SequenceMatcher
-
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
+
+try:
+    # Optional C implementation of difflib.SequenceMatcher (pip install cdifflib)
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
+from rich.cells import cell_len
 from rich.markup import escape
 from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Static, Tab, Tabs
+from textual.worker import get_current_worker
 
 from delta_vision.utils.base_screen import BaseScreen
 from delta_vision.utils.config import config
-from delta_vision.utils.diff_engine import DiffRow, DiffType, compute_diff_rows
-from delta_vision.utils.file_parsing import parse_header_metadata, read_file_pair
-from delta_vision.utils.fs import format_mtime, get_mtime, minutes_between
+from delta_vision.utils.diff_engine import DiffRow, DiffType, common_affixes, compute_diff_rows, myers_opcodes
+from delta_vision.utils.file_parsing import parse_header_metadata, read_file_pair, read_file_with_fallback
+from delta_vision.utils.fs import format_mtime, minutes_between
 from delta_vision.utils.keyword_highlighter import KeywordHighlighter
 from delta_vision.utils.logger import log
+from delta_vision.utils.text import make_keyword_pattern
 from delta_vision.utils.watchdog import start_observer
+from delta_vision.widgets.diff_lines import DiffLines
 
 from .keywords_parser import parse_keywords_md
 
+# Word-diff tokens: runs of non-whitespace or whitespace, with no empty padding
+_TOKEN_RE = re.compile(r"\S+|\s+")
+_WS_RE = re.compile(r"\s")
+
+# Tokens made only of these characters can never be read as Rich markup
+_SAFE_RE = re.compile(r"[A-Za-z0-9 _./:\-]*")
+
+
+def _end_of_line(markup: str) -> str:
+    """Collapse a trailing backslash run to what Rich shows before a closing tag.
+
+    ``escape`` doubles a lone trailing backslash so a tag appended after it is
+    not escaped. Unwrapped text can end a line with no tag following, and Rich
+    would then show both backslashes.
+    """
+    if not markup.endswith("\\"):
+        return markup
+    body = markup.rstrip("\\")
+    return body + "\\" * ((len(markup) - len(body)) // 2)
+
+
+# Line-number gutter: 6 digits + space + pipe + space = 9 chars. Missing lines
+# (None) get no pipe, only spacing for alignment. Common numbers are preformatted.
+_LN_BLANK = " " * 9
+_LN_CACHE = [f"{i:>6} | " for i in range(10000)]
+
+
+def _ln(n: int | None) -> str:
+    """Return the line-number gutter for ``n``."""
+    if n is None:
+        return _LN_BLANK
+    return _LN_CACHE[n] if 0 <= n < 10000 else f"{n:>6} | "
+
+
+# Appended to lines clamped by _apply_line_length_limits; clamped lines stay within the cap
+_ELLIPSIS = " …"
+_ELLIPSIS_LEN = len(_ELLIPSIS)
+
+# Styled panel title prefixes; copied and extended with the label on each update
+_OLD_TITLE = Text.assemble(("OLD", "yellow"), " — ")
+_NEW_TITLE = Text.assemble(("NEW", "green"), " — ")
+
+# Panel methods driven by the j/k/g/G keys
+_SCROLL_METHODS = ("scroll_down", "scroll_up", "scroll_home", "scroll_end")
+
+# Changed token runs longer than this on both sides are marked as one replaced
+# span; running the matcher on them costs far more than the detail is worth
+_WORD_DIFF_MAX_TOKENS = 400
+
+# Token edit distance up to which word diffs use Myers; lines rewritten more
+# heavily than this go to SequenceMatcher
+_WORD_DIFF_MAX_D = 64
+
+# Tab labels show whole minutes between integer ns mtimes
+_NS_PER_MINUTE = 60_000_000_000
+
+# Recently shown diffs whose rendered lines are kept for tab revisits
+_RENDERED_HISTORY = 8
+
+# Folders with fewer header files than this are read without a thread pool
+_HEADER_POOL_MIN = 16
+
+
+@lru_cache(maxsize=512)
+def _cached_header(path: str, mtime_ns: int, size: int) -> dict[str, str | None] | None:
+    """Memoized ``parse_header_metadata``; the stat signature in the key invalidates stale entries.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return parse_header_metadata(path)
+
+
+def _header_metadata(path: str, st: os.stat_result | None = None) -> dict[str, str | None] | None:
+    """Return header metadata for ``path``, re-parsing only when the file changed."""
+    if not path:
+        return None
+    try:
+        if st is None:
+            st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _cached_header(path, st.st_mtime_ns, st.st_size)
+
+
+def _stat_signature(path: str) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for ``path``, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path) if path else None
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size) if st else None
+
+
+@lru_cache(maxsize=8)
+def _cached_file_lines(path: str, sig) -> list[str]:
+    """Memoized ``read_file_with_fallback``; the stat signature in the key invalidates stale entries.
+
+    Every tab diffs against the same latest NEW file, so it is read once. The
+    returned list is shared and must not be mutated.
+    """
+    return read_file_with_fallback(path)
+
+
+@lru_cache(maxsize=16)
+def _cached_diff_rows(old_path: str, new_path: str, old_sig, new_sig) -> list[DiffRow]:
+    """Memoized read-and-diff of a file pair; the stat signatures in the key invalidate stale entries.
+
+    Revisiting a tab reuses its rows. The returned list is shared and must not be mutated.
+    """
+    return compute_diff_rows(_cached_file_lines(old_path, old_sig), _cached_file_lines(new_path, new_sig))
+
+
+@lru_cache(maxsize=4)
+def _cached_keywords(path: str, sig) -> dict:
+    """Memoized ``parse_keywords_md``; the stat signature in the key invalidates stale entries.
+
+    Diff screens opened one after another get the same dict back, which lets the
+    shared highlighter below reuse its compiled pattern. The dict must not be mutated.
+    """
+    return parse_keywords_md(path)
+
+
+# Shared by all diff screens so the keyword pattern is compiled once per keywords file
+_HIGHLIGHTER = KeywordHighlighter()
+
+
+def _file_info(path: str) -> tuple[dict[str, str | None], str | None]:
+    """Return ``(header_metadata, formatted_mtime)`` for ``path`` from a single stat.
+
+    Missing files yield empty metadata and no timestamp.
+    """
+    try:
+        st = os.stat(path) if path else None
+    except OSError:
+        st = None
+    if st is None:
+        return {"date": None, "time": None, "cmd": None}, None
+    meta = _header_metadata(path, st) or {"date": None, "time": None, "cmd": None}
+    return meta, format_mtime(path, mtime=st.st_mtime)
+
+
+@lru_cache(maxsize=32)
+def _keyword_subset_pattern(words: frozenset[str]) -> re.Pattern | None:
+    """Compile (once per distinct set) a keyword pattern for ``words``."""
+    return make_keyword_pattern(words, whole_word=True, case_insensitive=True)
+
+
+def _keywords_present(rows: list[DiffRow], keyword_lookup: dict[str, tuple[str, str]]) -> re.Pattern | None:
+    """Return a pattern for just the keywords that occur in ``rows``, or None.
+
+    One findall over the joined row text replaces a search of the full keyword
+    alternation in every token. Keywords containing whitespace are left out:
+    word-diff tokens never contain whitespace, so they cannot match a token,
+    and in the joined scan they could hide a shorter keyword inside them.
+    """
+    scan = _keyword_subset_pattern(frozenset(k for k in keyword_lookup if not _WS_RE.search(k)))
+    if scan is None:
+        return None
+    joined = "\n".join(text for row in rows for text in (row.left_content, row.right_content) if text)
+    found = frozenset(word.lower() for word in scan.findall(joined))
+    return _keyword_subset_pattern(found) if found else None
+
+
+def _read_header_entry(item: tuple[str, os.stat_result]) -> dict[str, str | None] | None:
+    """Header metadata for one ``(path, stat)`` pair; failures are logged and yield None."""
+    path, st = item
+    try:
+        return _header_metadata(path, st)
+    except (OSError, ValueError, AttributeError):
+        log(f"Failed to process file {path} for command occurrences")
+        return None
+
+
+def _read_headers(candidates: list[tuple[str, os.stat_result]]) -> list[dict[str, str | None] | None]:
+    """Return header metadata for each ``(path, stat)`` pair, in order.
+
+    Header reads are mostly waiting on the disk, so large folders fan them
+    out over a thread pool; small ones are read inline where thread start-up
+    would cost more than it saves.
+    """
+    if len(candidates) < _HEADER_POOL_MIN:
+        return [_read_header_entry(item) for item in candidates]
+    with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as pool:
+        return list(pool.map(_read_header_entry, candidates))
+
 
 class SideBySideDiffScreen(BaseScreen):
     """Show a side-by-side diff between two files (NEW vs OLD).
@@ -93,33 +292,72 @@ class SideBySideDiffScreen(BaseScreen):
         self._tab_order = []
         # Track current active tab id
         self._active_tab_id = None
+        # (latest_new, cmd) while the OLD tabs have not been scanned for yet
+        self._pending_old_tabs = None
+        # path -> mtime (ns) from the last occurrence scan, reused for tab labels
+        self._scan_mtimes = {}
         # Panels and content
         self._left_panel = None
         self._right_panel = None
         self._left_content = None
         self._right_content = None
+        # Title, subtitle and content widgets of each panel, kept from compose so
+        # repaints don't have to query the widget tree
+        self._lp_title = None
+        self._rp_title = None
+        self._lp_sub = None
+        self._rp_sub = None
+        self._lp_text = None
+        self._rp_text = None
         # Vim-like state
         self._last_g = False
+        # Scroll method name -> bound methods on both content panels (set on mount)
+        self._scroll_fns = {}
+        # Key -> handler for on_key; 'g'/'gg' is handled separately there
+        self._key_handlers = {
+            'j': partial(self._apply_to_both_panels, 'scroll_down'),
+            'k': partial(self._apply_to_both_panels, 'scroll_up'),
+            'G': partial(self._apply_to_both_panels, 'scroll_end'),
+            'h': self.action_prev_tab,
+            'l': self.action_next_tab,
+        }
         # Keyword highlight state (enabled by default)
         self.keyword_highlight_enabled = True
-        self._keyword_highlighter = KeywordHighlighter()
+        self._keyword_highlighter = _HIGHLIGHTER
         self._keywords_dict = None
         # Cache of built rows
         self._rows_cache = []
+        # Rendered (left_lines, right_lines) for _rendered_rows, keyed by highlight state
+        self._rendered_rows = None
+        self._rendered_cache = {}
+        # Widest left/right row in cells, for the panels' horizontal scroll range
+        self._rendered_widths = (0, 0)
+        # id(rows) -> (rows, rendered cache, widths) for recently shown diffs, oldest first
+        self._rendered_history = {}
         # Per-side metadata parsed from header line
         self._old_meta = {"date": None, "time": None, "cmd": None}
         self._new_meta = {"date": None, "time": None, "cmd": None}
         # Filesystem modified timestamps (formatted)
         self._old_created = None
         self._new_created = None
+        # Panel title labels (header command or file name), set with the metadata
+        self._old_label = ""
+        self._new_label = ""
+        # Set when the metadata above changes; titles are only rewritten then
+        self._titles_stale = True
         # Watchdog observers for live updates
         self._observer_old = None
         self._observer_new = None
         self._stop_old = None
         self._stop_new = None
+        # (old_dir, new_dir) being watched; new_dir is None when both share a folder
+        self._watched_dirs = None
         # Store scroll positions for state preservation
         self._left_scroll_y = 0
         self._right_scroll_y = 0
+        # Pending coalesced refresh timer, and the stat signatures of the pair last diffed
+        self._refresh_timer = None
+        self._pair_sigs = None
 
     def compose_main_content(self) -> ComposeResult:
         """Build tabs and two file panels for side-by-side diff.
@@ -133,26 +371,16 @@ class SideBySideDiffScreen(BaseScreen):
         with Vertical(id="diff-root"):
             with Horizontal(id="diff-columns"):
                 # OLD panel
-                self._left_panel = Vertical(
-                    Static("", classes="file-title"),
-                    Static("", classes="file-subtitle"),
-                    Vertical(
-                        Static("", classes="file-text", markup=True),
-                        classes="file-content",
-                    ),
-                    classes="file-panel",
-                )
+                self._lp_title = Static("", classes="file-title")
+                self._lp_sub = Static("", classes="file-subtitle")
+                self._lp_text = DiffLines(classes="file-content", id="left-text")
+                self._left_panel = Vertical(self._lp_title, self._lp_sub, self._lp_text, classes="file-panel")
                 yield self._left_panel
                 # NEW panel
-                self._right_panel = Vertical(
-                    Static("", classes="file-title"),
-                    Static("", classes="file-subtitle"),
-                    Vertical(
-                        Static("", classes="file-text", markup=True),
-                        classes="file-content",
-                    ),
-                    classes="file-panel",
-                )
+                self._rp_title = Static("", classes="file-title")
+                self._rp_sub = Static("", classes="file-subtitle")
+                self._rp_text = DiffLines(classes="file-content", id="right-text")
+                self._right_panel = Vertical(self._rp_title, self._rp_sub, self._rp_text, classes="file-panel")
                 yield self._right_panel
 
     def get_footer_text(self) -> str:
@@ -172,18 +400,14 @@ class SideBySideDiffScreen(BaseScreen):
 
         # Try to show command in the title, like the file viewer
         # Also parse date/time for subtitles
-        self._new_meta = parse_header_metadata(self.new_path) or {"date": None, "time": None, "cmd": None}
-        self._old_meta = parse_header_metadata(self.old_path) or {"date": None, "time": None, "cmd": None}
+        self._load_file_info()
         cmd = self._new_meta.get("cmd") or self._old_meta.get("cmd")
         if cmd:
             self.title = f"{cmd} — Diff"
-        # Filesystem modified timestamps
-        self._old_created = format_mtime(self.old_path)
-        self._new_created = format_mtime(self.new_path)
         # Parse keywords dict if provided
         try:
             if self.keywords_path and os.path.isfile(self.keywords_path):
-                self._keywords_dict = parse_keywords_md(self.keywords_path)
+                self._keywords_dict = _cached_keywords(self.keywords_path, _stat_signature(self.keywords_path))
         except (OSError, re.error, ValueError):
             log("Failed to parse keywords file")
             self._keywords_dict = None
@@ -201,10 +425,8 @@ class SideBySideDiffScreen(BaseScreen):
 
         # Cache content widgets for scrolling
         try:
-            if self._left_panel:
-                self._left_content = self._left_panel.query_one('.file-content', Vertical)
-            if self._right_panel:
-                self._right_content = self._right_panel.query_one('.file-content', Vertical)
+            self._left_content = self._lp_text
+            self._right_content = self._rp_text
             # Ensure both panels are scrolled to the top initially
             for cont in (self._left_content, self._right_content):
                 try:
@@ -218,36 +440,49 @@ class SideBySideDiffScreen(BaseScreen):
             self._left_content = None
             self._right_content = None
 
+        # Bind the scroll methods once so key repeat does not re-resolve them
+        panels = [w for w in (self._left_content, self._right_content) if w is not None]
+        self._scroll_fns = {name: [getattr(w, name) for w in panels] for name in _SCROLL_METHODS}
+
         # Start watchdog observers for live updates
         self._start_file_observers()
 
     def _start_file_observers(self):
-        """Start file system observers for both files."""
+        """Watch the folders of both files, one observer per distinct folder.
+
+        Tab switches keep the observers when the folders stay the same; events
+        for files other than the shown pair are filtered out by ``refresh_diff``.
+        """
 
         def trigger_refresh():
             """Callback for filesystem changes."""
             try:
-                self.call_later(self.refresh_diff)
+                self.call_later(self._request_refresh)
             except Exception as e:
                 log(f"[ERROR] Failed in trigger_refresh: {e}")
 
+        old_dir = os.path.dirname(self.old_path) if self.old_path and os.path.isfile(self.old_path) else None
+        new_dir = os.path.dirname(self.new_path) if self.new_path and os.path.isfile(self.new_path) else None
+        if new_dir == old_dir:
+            new_dir = None
+        if self._watched_dirs == (old_dir, new_dir):
+            return
+        self._stop_file_observers()
+        self._watched_dirs = (old_dir, new_dir)
+
         # Start observer for old file
         try:
-            if self.old_path and os.path.isfile(self.old_path):
-                self._observer_old, self._stop_old = start_observer(
-                    os.path.dirname(self.old_path), trigger_refresh, debounce_ms=500
-                )
+            if old_dir is not None:
+                self._observer_old, self._stop_old = start_observer(old_dir, trigger_refresh, debounce_ms=500)
         except (OSError, RuntimeError) as e:
             log(f"Failed to start observer for old file: {e}")
             self._observer_old = None
             self._stop_old = None
 
-        # Start observer for new file
+        # Start observer for new file, unless it shares the old file's folder
         try:
-            if self.new_path and os.path.isfile(self.new_path):
-                self._observer_new, self._stop_new = start_observer(
-                    os.path.dirname(self.new_path), trigger_refresh, debounce_ms=500
-                )
+            if new_dir is not None:
+                self._observer_new, self._stop_new = start_observer(new_dir, trigger_refresh, debounce_ms=500)
         except (OSError, RuntimeError) as e:
             log(f"Failed to start observer for new file: {e}")
             self._observer_new = None
@@ -261,9 +496,37 @@ class SideBySideDiffScreen(BaseScreen):
                     stop_fn()
                 except Exception as e:
                     log(f"Failed to stop observer: {e}")
+        self._observer_old = self._observer_new = None
+        self._stop_old = self._stop_new = None
+        self._watched_dirs = None
+
+    def _request_refresh(self):
+        """Schedule a refresh, coalescing bursts of events from the OLD and NEW watchers.
+
+        While a refresh is pending, further requests are absorbed by it.
+        """
+        if self._refresh_timer is not None:
+            return
+        try:
+            self._refresh_timer = self.set_timer(0.2, self._run_pending_refresh)
+        except (AttributeError, RuntimeError) as e:
+            log(f"Failed to schedule diff refresh, refreshing now: {e}")
+            self.refresh_diff()
+
+    def _run_pending_refresh(self):
+        """Run the coalesced refresh scheduled by ``_request_refresh``."""
+        self._refresh_timer = None
+        self.refresh_diff()
 
     def refresh_diff(self):
         """Refresh the diff view when files change."""
+        # Events for other files in the watched folders leave the shown pair untouched
+        if self._pair_sigs is not None and self._pair_sigs == (
+            _stat_signature(self.old_path),
+            _stat_signature(self.new_path),
+        ):
+            return
+
         # Store current scroll positions
         try:
             if self._left_content:
@@ -273,21 +536,17 @@ class SideBySideDiffScreen(BaseScreen):
         except (AttributeError, RuntimeError):
             log("Failed to capture scroll positions")
 
-        # Re-read files and rebuild diff
+        # Re-read files and rebuild diff; the repaint and scroll restore land
+        # in the same screen update so the panels never flash back to the top
         try:
-            # Use current tab's file pair
-            if self._active_tab_id and self._active_tab_id in self._tab_map:
-                pair = self._tab_map[self._active_tab_id]
-                self._set_pair_and_populate(pair[0], pair[1])
-            else:
-                # Fallback to original pair
-                old_lines, new_lines = read_file_pair(self.old_path, self.new_path)
-                rows = compute_diff_rows(old_lines, new_lines)
-                self._rows_cache = rows
-                self._populate(rows)
-
-            # Restore scroll positions
-            self._restore_scroll_positions()
+            with self.app.batch_update():
+                # Use current tab's file pair; scroll is restored once the worker's diff lands
+                if self._active_tab_id and self._active_tab_id in self._tab_map:
+                    pair = self._tab_map[self._active_tab_id]
+                    self._set_pair_and_populate(pair[0], pair[1], restore_scroll=True)
+                else:
+                    # Fallback to original pair
+                    self._start_diff_worker(self.old_path, self.new_path, restore_scroll=True)
         except (OSError, RuntimeError) as e:
             log(f"Failed to refresh diff: {e}")
 
@@ -302,56 +561,91 @@ class SideBySideDiffScreen(BaseScreen):
             log("Failed to restore scroll positions")
 
     def on_unmount(self):
-        """Stop observers when leaving the screen."""
+        """Stop observers and any pending refresh when leaving the screen."""
+        if self._refresh_timer is not None:
+            try:
+                self._refresh_timer.stop()
+            except (AttributeError, RuntimeError) as e:
+                log(f"Failed to cancel pending diff refresh: {e}")
+            self._refresh_timer = None
         self._stop_file_observers()
 
     def _build_tabs_and_select_default(self):
-        """Create tabs for latest NEW vs all occurrences (older NEW + all OLD files)."""
-        # Find latest file and all occurrences
-        latest_new, other_new_files, old_files = self._find_latest_and_others()
+        """Create tabs for latest NEW vs all occurrences (older NEW + all OLD files).
+
+        When prior NEW runs exist the default tab is one of them, so scanning
+        the OLD folder is deferred until the first diff is on screen (or the
+        user cycles tabs, whichever comes first).
+        """
+        # Find latest file and its prior occurrences
+        latest_new, other_new_files, cmd = self._find_latest_and_others()
 
         # Prepare tab system
         tabs = self._prepare_tab_system()
         if tabs is None:
             return
 
-        # Build all tabs
-        default_tab_id = self._build_all_tabs(tabs, latest_new, other_new_files, old_files)
+        # Add every tab inside one batch so the tab bar is laid out and painted once
+        old_files = None
+        if not other_new_files:
+            # No prior NEW runs: an OLD tab is the default, so it is needed now
+            old_files = self._find_old_occurrences(cmd)
+        with self.app.batch_update():
+            # Add prior NEW comparisons first (2nd newest, 3rd newest, ...)
+            default_tab_id = self._add_prior_new_tabs(tabs, latest_new, other_new_files, None)
+            if old_files is not None:
+                default_tab_id = self._add_old_tabs(tabs, latest_new, old_files, None)
+                default_tab_id = self._add_fallback_tab(tabs, latest_new, default_tab_id)
+
+        if old_files is None:
+            # OLD tabs follow the prior NEW tabs; add them after the first paint
+            self._pending_old_tabs = (latest_new, cmd)
+            self.call_after_refresh(self._add_pending_old_tabs)
 
         # Select default tab and populate content
         self._select_default_tab_and_populate(default_tab_id, latest_new)
 
-    def _find_latest_and_others(self) -> tuple[str, list[str], list[str]]:
-        """Find the latest file and all occurrences for tab creation.
+    def _find_latest_and_others(self) -> tuple[str, list[str], str | None]:
+        """Find the latest NEW file and its prior occurrences for tab creation.
 
         Returns:
-            Tuple of (latest_new_path, other_new_files, old_files)
+            Tuple of (latest_new_path, other_new_files, cmd)
         """
-        # Determine the command and find latest NEW file
-        latest_new = self._newest_for_command(self.new_path)
-        if latest_new is None:
-            latest_new = self.new_path
-
-        meta0 = parse_header_metadata(latest_new) if latest_new else None
-        cmd = meta0.get("cmd") if isinstance(meta0, dict) else None
-
-        # Find all NEW occurrences
-        new_folder = os.path.dirname(latest_new) if latest_new else None
+        # Determine the command and find all NEW occurrences; the newest is the baseline
+        meta = _header_metadata(self.new_path) or {}
+        cmd = meta.get("cmd")
+        new_folder = os.path.dirname(self.new_path)
         new_occurrences: list[str] = []
-        if cmd and new_folder and os.path.isdir(new_folder):
+        if cmd and os.path.isdir(new_folder):
             new_occurrences = self._find_occurrences(new_folder, cmd)
-
-        # Find all OLD occurrences
-        old_folder = os.path.dirname(self.old_path) if self.old_path else None
-        old_occurrences: list[str] = []
-        if cmd and old_folder and os.path.isdir(old_folder):
-            old_occurrences = self._find_occurrences(old_folder, cmd)
+        latest_new = new_occurrences[0] if new_occurrences else self.new_path
 
         # Ensure the absolute newest NEW appears as the baseline; other NEW occurrences
         # (older NEWs) become additional tabs for comparison.
         other_new_files = [p for p in new_occurrences if p != latest_new]
 
-        return latest_new, other_new_files, old_occurrences
+        return latest_new, other_new_files, cmd
+
+    def _find_old_occurrences(self, cmd: str | None) -> list[str]:
+        """Return all OLD files carrying ``cmd``, newest first."""
+        old_folder = os.path.dirname(self.old_path) if self.old_path else None
+        if cmd and old_folder and os.path.isdir(old_folder):
+            return self._find_occurrences(old_folder, cmd)
+        return []
+
+    def _add_pending_old_tabs(self):
+        """Scan for OLD occurrences deferred by ``_build_tabs_and_select_default``."""
+        pending = self._pending_old_tabs
+        if pending is None or self._tabs is None:
+            return
+        self._pending_old_tabs = None
+        latest_new, cmd = pending
+        try:
+            old_files = self._find_old_occurrences(cmd)
+            with self.app.batch_update():
+                self._add_old_tabs(self._tabs, latest_new, old_files, self._active_tab_id)
+        except (OSError, AttributeError, RuntimeError):
+            log("Failed to add OLD comparison tabs")
 
     def _prepare_tab_system(self):
         """Prepare the tab system by clearing existing tabs and resetting state.
@@ -364,6 +658,7 @@ class SideBySideDiffScreen(BaseScreen):
             return None
 
         # Clear any existing tabs to avoid duplicates on rebuild
+        self._pending_old_tabs = None
         try:
             clear = getattr(tabs, "clear", None)
             if callable(clear):
@@ -379,31 +674,6 @@ class SideBySideDiffScreen(BaseScreen):
 
         return tabs
 
-    def _build_all_tabs(self, tabs, latest_new: str, other_new_files: list[str], old_files: list[str]) -> str | None:
-        """Build all tabs (prior NEW, all OLD, fallback) and return default tab ID.
-
-        Args:
-            tabs: The tabs widget
-            latest_new: Path to the latest NEW file
-            other_new_files: List of other NEW file paths
-            old_files: List of all OLD file paths
-
-        Returns:
-            The default tab ID to select, or None if no tabs were created
-        """
-        default_tab_id: str | None = None
-
-        # Add prior NEW comparisons first (2nd newest, 3rd newest, ...)
-        default_tab_id = self._add_prior_new_tabs(tabs, latest_new, other_new_files, default_tab_id)
-
-        # Add OLD comparison tabs (one for each OLD file)
-        default_tab_id = self._add_old_tabs(tabs, latest_new, old_files, default_tab_id)
-
-        # Add fallback tab if needed
-        default_tab_id = self._add_fallback_tab(tabs, latest_new, default_tab_id)
-
-        return default_tab_id
-
     def _add_prior_new_tabs(
         self, tabs, latest_new: str, other_new_files: list[str], default_tab_id: str | None
     ) -> str | None:
@@ -412,19 +682,19 @@ class SideBySideDiffScreen(BaseScreen):
         Returns:
             The updated default_tab_id (first tab added if none set yet)
         """
+        t_latest = self._tab_mtime(latest_new)
         for idx, other in enumerate(other_new_files, start=1):
-            # Directional minutes with sign: floor((latest - other)/60)
+            # Directional minutes with sign: floor((latest - other) / 1 min)
             # A negative value means "older than latest".
             mins = None
             try:
-                t_latest = get_mtime(latest_new)
-                t_other = get_mtime(other)
+                t_other = self._tab_mtime(other)
                 if t_latest is not None and t_other is not None:
-                    mins = math.floor((t_latest - t_other) / 60.0)
+                    mins = (t_latest - t_other) // _NS_PER_MINUTE
             except (OSError, ValueError):
                 log(f"Failed to calculate time difference between {latest_new} and {other}")
                 mins = None
-            meta = parse_header_metadata(other) or {}
+            meta = _header_metadata(other) or {}
             fallback = meta.get("date") or os.path.basename(other)
             label = f"{mins:+d}m" if mins is not None else fallback
             tab_id = f"n{idx}"
@@ -445,15 +715,15 @@ class SideBySideDiffScreen(BaseScreen):
         if not old_files:
             return default_tab_id
 
+        t_latest = self._tab_mtime(latest_new)
         for idx, old_file in enumerate(old_files):
             # Calculate time difference for labeling
             mins = None
             try:
-                t_latest = get_mtime(latest_new)
-                t_old = get_mtime(old_file)
+                t_old = self._tab_mtime(old_file)
                 if t_latest is not None and t_old is not None:
                     # OLD files are typically older, so this will be positive
-                    mins = math.floor((t_latest - t_old) / 60.0)
+                    mins = (t_latest - t_old) // _NS_PER_MINUTE
             except (OSError, ValueError):
                 log(f"Failed to calculate time difference between {latest_new} and {old_file}")
                 mins = None
@@ -532,65 +802,165 @@ class SideBySideDiffScreen(BaseScreen):
                 self._set_pair_and_populate(pair[0], pair[1])
         else:
             # Fallback: no tabs created, show basic diff
-            old_lines, new_lines = read_file_pair(self.old_path, self.new_path)
-            rows = compute_diff_rows(old_lines, new_lines)
-            self._rows_cache = rows
-            self._populate(rows)
-
-    def _newest_for_command(self, some_path: str) -> str | None:
-        """Return the newest file in the same folder with the same command as some_path."""
-        meta = parse_header_metadata(some_path) or {}
-        cmd = meta.get("cmd")
-        folder = os.path.dirname(some_path)
-        if not cmd or not os.path.isdir(folder):
-            return some_path
-        candidates = self._find_occurrences(folder, cmd)
-        return candidates[0] if candidates else some_path
+            self._start_diff_worker(self.old_path, self.new_path)
 
     def _find_occurrences(self, folder: str, cmd: str) -> list[str]:
         """Find all files in folder with header command equal to cmd, newest first."""
-        items: list[tuple[str, float]] = []
+        candidates: list[tuple[str, os.stat_result]] = []
+        skipped = 0
         try:
-            for name in os.listdir(folder):
-                path = os.path.join(folder, name)
-                if not os.path.isfile(path):
-                    continue
-                try:
-                    meta = parse_header_metadata(path) or {}
-                    if meta.get("cmd") == cmd:
-                        items.append((path, os.path.getmtime(path)))
-                except (OSError, ValueError, AttributeError):
-                    log(f"Failed to process file {path} for command occurrences")
-                    continue
+            with os.scandir(folder) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        # One stat per entry serves the type check, cache key and sort key
+                        st = entry.stat()
+                    except OSError:
+                        # Counted and logged once below rather than per file
+                        skipped += 1
+                        continue
+                    # An empty file has no header, so it cannot carry the command
+                    if st.st_size:
+                        candidates.append((entry.path, st))
         except OSError:
             log(f"Failed to list directory {folder} for occurrences")
             pass
-        items.sort(key=lambda t: t[1], reverse=True)
+        if skipped:
+            log(f"Skipped {skipped} unreadable entries in {folder} while looking for command occurrences")
+        metas = _read_headers(candidates)
+        items = [
+            (path, st.st_mtime_ns) for (path, st), meta in zip(candidates, metas) if meta and meta.get("cmd") == cmd
+        ]
+        items.sort(key=itemgetter(1), reverse=True)
+        self._scan_mtimes.update(items)
         return [p for p, _ in items]
 
-    def _set_pair_and_populate(self, older_path: str, latest_path: str):
-        """Set the current paths and repaint panels accordingly."""
-        # Stop existing observers if paths are changing
-        if older_path != self.old_path or latest_path != self.new_path:
-            self._stop_file_observers()
+    def _tab_mtime(self, path: str) -> int | None:
+        """Modification time in ns for a tab label, from the occurrence scan when it saw ``path``."""
+        mtime = self._scan_mtimes.get(path)
+        if mtime is None:
+            sig = _stat_signature(path)
+            mtime = sig[0] if sig else None
+        return mtime
+
+    def _set_pair_and_populate(self, older_path: str, latest_path: str, restore_scroll: bool = False):
+        """Set the current paths and repaint panels accordingly.
+
+        Reading, diffing and rendering the pair runs in a worker thread and the
+        panels are repainted on the event loop when it finishes. Each call
+        cancels the previous one, so rapid tab cycling only paints the last pick.
 
+        Args:
+            older_path: File shown in the left panel
+            latest_path: File shown in the right panel
+            restore_scroll: Restore the saved scroll positions after repainting
+        """
         self.old_path = older_path
         self.new_path = latest_path
 
-        # Update metadata and repaint
-        self._old_meta = parse_header_metadata(self.old_path) or {"date": None, "time": None, "cmd": None}
-        self._new_meta = parse_header_metadata(self.new_path) or {"date": None, "time": None, "cmd": None}
-        # Refresh created timestamps for subtitles
-        self._old_created = format_mtime(self.old_path)
-        self._new_created = format_mtime(self.new_path)
-        old_lines, new_lines = read_file_pair(self.old_path, self.new_path)
-        rows = compute_diff_rows(old_lines, new_lines)
-        self._rows_cache = rows
-        self._populate(rows)
+        # Update metadata and modified timestamps for the titles, then repaint
+        self._load_file_info()
+        self._start_diff_worker(older_path, latest_path, restore_scroll)
 
-        # Restart observers for new file paths
+        # Move the observers if the pair lives in different folders
         self._start_file_observers()
 
+    def _start_diff_worker(self, older_path: str, latest_path: str, restore_scroll: bool = False):
+        """Read, diff and render a pair off the event loop; a newer call cancels this one."""
+        self._pair_sigs = (_stat_signature(older_path), _stat_signature(latest_path))
+        self.run_worker(
+            partial(self._compute_diff, older_path, latest_path, restore_scroll),
+            group="diff",
+            exclusive=True,
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _compute_diff(self, older_path: str, latest_path: str, restore_scroll: bool):
+        """Read, diff and render a file pair; runs in a worker thread."""
+        worker = get_current_worker()
+        try:
+            rows = _cached_diff_rows(older_path, latest_path, _stat_signature(older_path), _stat_signature(latest_path))
+            if worker.is_cancelled:
+                return
+            highlight = self.keyword_highlight_enabled
+            # Revisited tabs get their cached rows back, and with them their rendering
+            entry = self._rendered_history.get(id(rows))
+            if entry is not None and entry[0] is rows and highlight in entry[1]:
+                rendered, widths = entry[1][highlight], entry[2]
+            else:
+                word_diff, equal_markup = self._create_diff_formatters(rows, highlight)
+                left_lines, right_lines = self._render_diff_lines(rows, word_diff, equal_markup)
+                rendered = self._apply_line_length_limits(left_lines, right_lines)
+                widths = self._content_widths(rows)
+        except Exception as e:
+            # The worker runs with exit_on_error=False: log here or the failure is silent
+            log(f"Failed to compute diff for {older_path} vs {latest_path}: {e}")
+            return
+        if not worker.is_cancelled:
+            self.app.call_from_thread(
+                self._apply_computed_diff, older_path, latest_path, rows, highlight, rendered, widths, restore_scroll
+            )
+
+    def _apply_computed_diff(
+        self,
+        older_path: str,
+        latest_path: str,
+        rows: list[DiffRow],
+        highlight: bool,
+        rendered: tuple[list[str], list[str]],
+        widths: tuple[int, int],
+        restore_scroll: bool,
+    ):
+        """Install a worker's rendered diff and repaint; runs on the event loop."""
+        if older_path != self.old_path or latest_path != self.new_path:
+            # A newer pair was selected while this one was being computed
+            return
+        self._rows_cache = rows
+        self._select_rendered_rows(rows, widths)
+        self._rendered_cache[highlight] = rendered
+        with self.app.batch_update():
+            self._populate(rows)
+            if restore_scroll:
+                self._restore_scroll_positions()
+
+    def _select_rendered_rows(self, rows: list[DiffRow], widths: tuple[int, int] | None = None):
+        """Make ``rows`` the rendered diff, restoring its renderings if it was shown recently."""
+        if rows is self._rendered_rows:
+            return
+        history = self._rendered_history
+        entry = history.pop(id(rows), None)
+        if entry is None or entry[0] is not rows:
+            entry = (rows, {}, widths if widths is not None else self._content_widths(rows))
+        # Re-insert as the newest entry and drop the oldest past the limit
+        history[id(rows)] = entry
+        if len(history) > _RENDERED_HISTORY:
+            del history[next(iter(history))]
+        self._rendered_rows, self._rendered_cache, self._rendered_widths = entry
+
+    def _render_rows(self, rows: list[DiffRow], highlight: bool):
+        """Render already-diffed rows for one highlight state; runs in a worker thread."""
+        worker = get_current_worker()
+        try:
+            word_diff, equal_markup = self._create_diff_formatters(rows, highlight)
+            left_lines, right_lines = self._render_diff_lines(rows, word_diff, equal_markup)
+            rendered = self._apply_line_length_limits(left_lines, right_lines)
+        except Exception as e:
+            log(f"Failed to render diff rows: {e}")
+            return
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._apply_rendered_rows, rows, highlight, rendered)
+
+    def _apply_rendered_rows(self, rows: list[DiffRow], highlight: bool, rendered: tuple[list[str], list[str]]):
+        """Cache a worker's rendering and repaint if it is still wanted; runs on the event loop."""
+        if rows is not self._rendered_rows:
+            # The diff was replaced while these rows were being rendered
+            return
+        self._rendered_cache[highlight] = rendered
+        if highlight == self.keyword_highlight_enabled:
+            self._populate(rows)
+
     def on_tabs_tab_activated(self, event: Tabs.TabActivated):
         """Switch the comparison when a tab is activated by the user."""
         tab_id = getattr(event.tab, "id", None)
@@ -602,6 +972,8 @@ class SideBySideDiffScreen(BaseScreen):
 
     def _cycle_tab(self, offset: int):
         """Move active tab left/right by offset within the known order."""
+        # Cycling needs the full tab order, including OLD tabs not yet scanned for
+        self._add_pending_old_tabs()
         tabs = self._tabs
         order = self._tab_order
         if not tabs or not order:
@@ -648,66 +1020,30 @@ class SideBySideDiffScreen(BaseScreen):
         if key is None:
             return
 
-        # Dispatch to specific key handlers
-        if key == 'j':
-            self._handle_scroll_down_key(event)
-        elif key == 'k':
-            self._handle_scroll_up_key(event)
-        elif key == 'G':
-            self._handle_scroll_end_key(event)
-        elif key == 'g':
-            self._handle_go_to_top_key(event)
-        elif key == 'h':
-            self._handle_prev_tab_key(event)
-        elif key == 'l':
-            self._handle_next_tab_key(event)
-        else:
-            self._last_g = False
-
-    def _handle_scroll_down_key(self, event):
-        """Handle j key - scroll both panels down."""
-        self._apply_to_both_panels('scroll_down')
-        self._last_g = False
-        self._stop_event(event, "scroll down")
-
-    def _handle_scroll_up_key(self, event):
-        """Handle k key - scroll both panels up."""
-        self._apply_to_both_panels('scroll_up')
-        self._last_g = False
-        self._stop_event(event, "scroll up")
+        if key == 'g':
+            # gg state machine: the first g arms, the second jumps to the top
+            if self._last_g:
+                self._apply_to_both_panels('scroll_home')
+            self._last_g = not self._last_g
+            self._stop_event(event, "'g' key")
+            return
 
-    def _handle_scroll_end_key(self, event):
-        """Handle G key - scroll both panels to end."""
-        self._apply_to_both_panels('scroll_end')
         self._last_g = False
-        self._stop_event(event, "scroll end")
-
-    def _handle_go_to_top_key(self, event):
-        """Handle g key - go to top with gg pattern."""
-        self._stop_event(event, "'g' key")
-        if self._last_g:
-            self._apply_to_both_panels('scroll_home')
-            self._last_g = False
-        else:
-            self._last_g = True
-
-    def _handle_toggle_highlights_key(self, event):
-        """Handle Ctrl+K key - toggle keyword highlights."""
-        self.action_toggle_highlights()
-        self._stop_event(event, "toggle highlights")
-
-    def _handle_prev_tab_key(self, event):
-        """Handle h key - navigate to previous tab."""
-        self.action_prev_tab()
-        self._stop_event(event, "prev tab")
-
-    def _handle_next_tab_key(self, event):
-        """Handle l key - navigate to next tab."""
-        self.action_next_tab()
-        self._stop_event(event, "next tab")
+        handler = self._key_handlers.get(key)
+        if handler is not None:
+            handler()
+            self._stop_event(event, f"'{key}' key")
 
     def _apply_to_both_panels(self, method_name: str):
         """Apply a method to both left and right content panels."""
+        bound = self._scroll_fns.get(method_name)
+        if bound is not None:
+            for method in bound:
+                try:
+                    method()
+                except (AttributeError, RuntimeError):
+                    log(f"Failed to call {method_name} on content widget")
+            return
         for widget in (self._left_content, self._right_content):
             try:
                 if widget is None:
@@ -729,7 +1065,18 @@ class SideBySideDiffScreen(BaseScreen):
         """Toggle keyword highlighting in the diff and repaint."""
         try:
             self.keyword_highlight_enabled = not self.keyword_highlight_enabled
-            self._populate(self._rows_cache)
+            rows = self._rows_cache
+            if rows is self._rendered_rows and self.keyword_highlight_enabled not in self._rendered_cache:
+                # First render in this state: highlight off the event loop, repaint when done
+                self.run_worker(
+                    partial(self._render_rows, rows, self.keyword_highlight_enabled),
+                    group="render",
+                    exclusive=True,
+                    thread=True,
+                    exit_on_error=False,
+                )
+            else:
+                self._populate(rows)
             self._update_footer()
         except (AttributeError, RuntimeError):
             log("Failed to toggle keyword highlights")
@@ -773,155 +1120,266 @@ class SideBySideDiffScreen(BaseScreen):
 
         Orchestrates the diff rendering process by calling focused helper methods.
         """
-        left = self._left_panel
-        right = self._right_panel
-        if not left or not right:
+        if not self._left_panel or not self._right_panel:
             return
 
-        # Create formatting functions
-        ln, word_diff = self._create_diff_formatters()
+        # Rendered lines only depend on the rows and the highlight toggle, so
+        # flipping highlights back and forth, or returning to a tab, reuses earlier output
+        self._select_rendered_rows(rows)
+        highlight = self.keyword_highlight_enabled
+        cached = self._rendered_cache.get(highlight)
+
+        if cached is None:
+            # Create formatting functions
+            word_diff, equal_markup = self._create_diff_formatters(rows, highlight)
 
-        # Render diff lines
-        left_lines, right_lines = self._render_diff_lines(rows, ln, word_diff)
+            # Render diff lines
+            left_lines, right_lines = self._render_diff_lines(rows, word_diff, equal_markup)
 
-        # Update panel titles and subtitles
-        self._update_panel_titles(left, right)
+            # Apply line length limits
+            cached = self._apply_line_length_limits(left_lines, right_lines)
+            self._rendered_cache[highlight] = cached
+        left_lines, right_lines = cached
 
-        # Apply line length limits
-        left_lines, right_lines = self._apply_line_length_limits(left_lines, right_lines)
+        # Apply titles and both panels' contents as one screen update so a tab
+        # switch or refresh costs a single layout pass
+        with self.app.batch_update():
+            # Update panel titles and subtitles
+            self._update_panel_titles()
 
-        # Update panel contents
-        self._update_panel_contents(left, right, left_lines, right_lines)
+            # Update panel contents
+            self._update_panel_contents(left_lines, right_lines)
 
-    def _create_diff_formatters(self):
+    def _create_diff_formatters(self, rows: list[DiffRow] | None = None, highlight: bool | None = None):
         """Create formatting functions for diff rendering.
 
+        Args:
+            rows: Rows about to be rendered; when given, keyword matching is
+                narrowed to the keywords that actually occur in them
+            highlight: Keyword highlight state to render for; defaults to the
+                current toggle, workers pass the state they were started with
+
         Returns:
-            Tuple of (line_number_formatter, word_diff_function)
+            Tuple of (word_diff_function, equal_markup_function)
         """
 
-        def ln(n: int | None) -> str:
-            # Straight ASCII pipe as separator
-            # For missing lines (None), don't draw the pipe; keep spacing for alignment only.
-            # Width is 6 digits + space + pipe + space = 9 chars.
-            return f"{n:>6} | " if n is not None else " " * 9
-
+        @lru_cache(maxsize=1024)
         def tokenize(s: str) -> list[str]:
-            # Keep whitespace as tokens so we can reconstruct spacing
-            return re.split(r"(\s+)", s)
+            # Keep whitespace as tokens so we can reconstruct spacing. Repeated
+            # text gets the same list object back, which lets the pooled matcher
+            # below skip rebuilding its index for an unchanged right-hand side.
+            # The lists are shared and must not be mutated.
+            return _TOKEN_RE.findall(s)
+
+        # One matcher per render; set_seq1/set_seq2 reuse it across rows
+        matcher = SequenceMatcher(None, autojunk=False)
+
+        # Snapshot the highlighting state once per render so per-token markup is a
+        # pure function of the token and can be memoized below.
+        if highlight is None:
+            highlight = self.keyword_highlight_enabled
+        pattern, keyword_lookup = None, {}
+        if highlight and self._keywords_dict:
+            # Use KeywordHighlighter to get pattern and color lookup
+            pattern, keyword_lookup = self._keyword_highlighter.get_pattern_and_lookup(self._keywords_dict)
+            if pattern and rows is not None:
+                pattern = _keywords_present(rows, keyword_lookup)
+        highlight_line = self._keyword_highlighter.highlight_line
 
         def highlight_keywords(s: str) -> str:
             # Apply keyword highlighting with colors from keywords.md
-            if not (self.keyword_highlight_enabled and self._keywords_dict):
-                return escape(s)
-
-            # Use KeywordHighlighter to get pattern and color lookup
-            pattern, keyword_lookup = self._keyword_highlighter.get_pattern_and_lookup(self._keywords_dict)
             if not pattern:
-                return escape(s)
-
+                # Plain words and paths contain no markup characters to escape
+                return s if _SAFE_RE.fullmatch(s) else escape(s)
             # Apply highlighting with colors (no underline to avoid clutter in diff view)
-            return self._keyword_highlighter.highlight_line(s, pattern, keyword_lookup, underline=False)
+            return highlight_line(s, pattern, keyword_lookup, underline=False)
 
+        @lru_cache(maxsize=4096)
         def process_token(tok: str) -> str:
-            # Preserve whitespace tokens; otherwise apply keyword highlighting
+            # Preserve whitespace tokens; otherwise apply keyword highlighting.
+            # Diffed files repeat the same tokens heavily, so the cache hit rate is high.
             if tok.isspace():
                 return tok
             return highlight_keywords(tok)
 
+        def diff_tokens(o_tokens: list[str], n_tokens: list[str]) -> list[tuple[str, int, int, int, int]]:
+            # Lines usually change in the middle: peel off the shared leading and
+            # trailing tokens and only run the matcher on what is left
+            pre, suf = common_affixes(o_tokens, n_tokens)
+            o_end = len(o_tokens) - suf
+            n_end = len(n_tokens) - suf
+            if min(o_end, n_end) - pre > _WORD_DIFF_MAX_TOKENS:
+                middle = [("replace", pre, o_end, pre, n_end)]
+            else:
+                affixed = pre or suf
+                o_mid = o_tokens[pre:o_end] if affixed else o_tokens
+                n_mid = n_tokens[pre:n_end] if affixed else n_tokens
+                # Edited lines are mostly a few tokens apart, where Myers is near-linear
+                middle = myers_opcodes(o_mid, n_mid, _WORD_DIFF_MAX_D)
+                if middle is None:
+                    matcher.set_seq2(n_mid)
+                    matcher.set_seq1(o_mid)
+                    middle = matcher.get_opcodes()
+                if not affixed:
+                    return middle
+                middle = [(tag, i1 + pre, i2 + pre, j1 + pre, j2 + pre) for tag, i1, i2, j1, j2 in middle]
+            opcodes = [("equal", 0, pre, 0, pre)] if pre else []
+            opcodes.extend(middle)
+            if suf:
+                opcodes.append(("equal", o_end, len(o_tokens), n_end, len(n_tokens)))
+            return opcodes
+
+        def side_markup(text: str, color: str) -> str:
+            # A line present on one side only is a single colored run
+            if not text:
+                return ""
+            return f"[{color}]{''.join(map(process_token, tokenize(text)))}[/{color}]"
+
         def word_diff(old_text: str, new_text: str) -> tuple[str, str]:
             """Return (left_markup, right_markup) with word-level coloring.
 
-            - Unchanged: white
+            - Unchanged: panel's default foreground (no markup)
             - Deletions (only in old): red (left side)
             - Insertions (only in new): green (right side)
             """
+            # Deleted and added rows diff against "": no opcodes or cache entry needed
+            if not new_text:
+                return side_markup(old_text, "red"), ""
+            if not old_text:
+                return "", side_markup(new_text, "green")
+            return changed_markup(old_text, new_text)
+
+        # Boilerplate edits repeat across a file; identical (old, new) pairs
+        # reuse the first pair's markup
+        @lru_cache(maxsize=4096)
+        def changed_markup(old_text: str, new_text: str) -> tuple[str, str]:
             o_tokens = tokenize(old_text)
             n_tokens = tokenize(new_text)
-            sm = SequenceMatcher(None, o_tokens, n_tokens)
+            if old_text == new_text:
+                # Identical text is a single equal run; skip the matcher entirely
+                opcodes = [("equal", 0, len(o_tokens), 0, len(n_tokens))]
+            else:
+                opcodes = diff_tokens(o_tokens, n_tokens)
+            # Every token lands in exactly one opcode on its side, so mark them all
+            # up in one C-level map pass and join slices below
+            o_marked = list(map(process_token, o_tokens))
+            n_marked = list(map(process_token, n_tokens))
             left_parts: list[str] = []
             right_parts: list[str] = []
-            for tag, i1, i2, j1, j2 in sm.get_opcodes():
+            for tag, i1, i2, j1, j2 in opcodes:
                 if tag == "equal":
-                    seg_o = "".join(process_token(t) for t in o_tokens[i1:i2])
-                    seg_n = "".join(process_token(t) for t in n_tokens[j1:j2])
-                    left_parts.append(f"[white]{seg_o}[/white]")
-                    right_parts.append(f"[white]{seg_n}[/white]")
+                    left_parts.append("".join(o_marked[i1:i2]))
+                    right_parts.append("".join(n_marked[j1:j2]))
                 elif tag == "delete":
-                    seg_o = "".join(process_token(t) for t in o_tokens[i1:i2])
+                    seg_o = "".join(o_marked[i1:i2])
                     left_parts.append(f"[red]{seg_o}[/red]")
                     # Nothing on right
                 elif tag == "insert":
-                    seg_n = "".join(process_token(t) for t in n_tokens[j1:j2])
+                    seg_n = "".join(n_marked[j1:j2])
                     right_parts.append(f"[green]{seg_n}[/green]")
                 elif tag == "replace":
-                    seg_o = "".join(process_token(t) for t in o_tokens[i1:i2])
-                    seg_n = "".join(process_token(t) for t in n_tokens[j1:j2])
+                    seg_o = "".join(o_marked[i1:i2])
+                    seg_n = "".join(n_marked[j1:j2])
                     left_parts.append(f"[red]{seg_o}[/red]")
                     right_parts.append(f"[green]{seg_n}[/green]")
-            return "".join(left_parts), "".join(right_parts)
+            return _end_of_line("".join(left_parts)), _end_of_line("".join(right_parts))
+
+        def equal_markup(text: str) -> str:
+            """Return the markup word_diff would emit for identical text on either side."""
+            return _end_of_line("".join(map(process_token, tokenize(text))))
 
-        return ln, word_diff
+        return word_diff, equal_markup
 
-    def _render_diff_lines(self, rows, ln, word_diff) -> tuple[list[str], list[str]]:
+    def _render_diff_lines(self, rows, word_diff, equal_markup) -> tuple[list[str], list[str]]:
         """Render diff rows into formatted left and right lines.
 
         Args:
             rows: Diff rows from compute_diff_rows
-            ln: Line number formatter function
             word_diff: Word-level diff function
+            equal_markup: Markup function for text that is identical on both sides
 
         Returns:
             Tuple of (left_lines, right_lines)
         """
-        left_lines: list[str] = []
-        right_lines: list[str] = []
-
-        for row in rows:
-            if row.diff_type == DiffType.UNCHANGED:
-                lmk, rmk = word_diff(row.left_content, row.right_content)
-                left_lines.append(f"{ln(row.left_line_num)}{lmk}")
-                right_lines.append(f"{ln(row.right_line_num)}{rmk}")
-            elif row.diff_type == DiffType.MODIFIED:
-                lmk, rmk = word_diff(row.left_content, row.right_content)
-                left_lines.append(f"{ln(row.left_line_num)}{lmk}")
-                right_lines.append(f"{ln(row.right_line_num)}{rmk}")
-            elif row.diff_type == DiffType.DELETED:
-                lmk, _ = word_diff(row.left_content, "")
-                left_lines.append(f"{ln(row.left_line_num)}{lmk}")
-                right_lines.append(f"{ln(row.right_line_num)}")
-            elif row.diff_type == DiffType.ADDED:
-                _, rmk = word_diff("", row.right_content)
-                left_lines.append(f"{ln(row.left_line_num)}")
-                right_lines.append(f"{ln(row.right_line_num)}{rmk}")
+        # Preallocate and fill by index: avoids list growth on large diffs
+        n = len(rows)
+        left_lines: list[str] = [""] * n
+        right_lines: list[str] = [""] * n
+        unchanged, modified, deleted, added = DiffType.UNCHANGED, DiffType.MODIFIED, DiffType.DELETED, DiffType.ADDED
+        # Local names keep the per-row gutter lookups off the globals dict
+        ln = _ln
+
+        for i, row in enumerate(rows):
+            diff_type = row.diff_type
+            left_text = row.left_content
+            right_text = row.right_content
+            if diff_type is unchanged and left_text == right_text:
+                # Most rows are unchanged: render once and reuse for both panels
+                mk = equal_markup(left_text)
+                left_lines[i] = ln(row.left_line_num) + mk
+                right_lines[i] = ln(row.right_line_num) + mk
+            elif diff_type is modified:
+                lmk, rmk = word_diff(left_text, right_text)
+                left_lines[i] = ln(row.left_line_num) + lmk
+                right_lines[i] = ln(row.right_line_num) + rmk
+            elif diff_type is deleted:
+                lmk, _ = word_diff(left_text, "")
+                left_lines[i] = ln(row.left_line_num) + lmk
+                right_lines[i] = ln(row.right_line_num)
+            elif diff_type is added:
+                _, rmk = word_diff("", right_text)
+                left_lines[i] = ln(row.left_line_num)
+                right_lines[i] = ln(row.right_line_num) + rmk
+            elif left_text == right_text:
+                # Fallback with identical text: same as an unchanged row
+                mk = equal_markup(left_text)
+                left_lines[i] = ln(row.left_line_num) + mk
+                right_lines[i] = ln(row.right_line_num) + mk
             else:
                 # Fallback: treat as equal
-                lmk, rmk = word_diff(row.left_content, row.right_content)
-                left_lines.append(f"{ln(row.left_line_num)}{lmk}")
-                right_lines.append(f"{ln(row.right_line_num)}{rmk}")
+                lmk, rmk = word_diff(left_text, right_text)
+                left_lines[i] = ln(row.left_line_num) + lmk
+                right_lines[i] = ln(row.right_line_num) + rmk
 
         return left_lines, right_lines
 
-    def _update_panel_titles(self, left, right):
-        """Update panel titles and subtitles with metadata."""
-        try:
-            lp_title = left.query_one('.file-title', Static)
-            rp_title = right.query_one('.file-title', Static)
-            lp_sub = left.query_one('.file-subtitle', Static)
-            rp_sub = right.query_one('.file-subtitle', Static)
-
-            old_cmd = self._old_meta.get("cmd") if isinstance(self._old_meta, dict) else None
-            new_cmd = self._new_meta.get("cmd") if isinstance(self._new_meta, dict) else None
+    def _content_widths(self, rows: list[DiffRow]) -> tuple[int, int]:
+        """Return the widest rendered left/right row in cells.
 
-            left_title_text = (
-                f"[yellow]OLD[/yellow] — {escape(old_cmd) if old_cmd else os.path.basename(self.old_path)}"
-            )
-            right_title_text = f"[green]NEW[/green] — {escape(new_cmd) if new_cmd else os.path.basename(self.new_path)}"
-
-            lp_title.update(Text.from_markup(left_title_text))
-            rp_title.update(Text.from_markup(right_title_text))
-            lp_sub.update(f"Modified: {self._old_created}" if self._old_created else "")
-            rp_sub.update(f"Modified: {self._new_created}" if self._new_created else "")
+        Each row is a 9-cell line-number gutter plus its content, capped the
+        same way ``_apply_line_length_limits`` caps the markup. Content is
+        measured in cells so wide (CJK, emoji) characters can be scrolled to.
+        """
+        left = max((cell_len(r.left_content) for r in rows), default=0) + 9
+        right = max((cell_len(r.right_content) for r in rows), default=0) + 9
+        cap = config.max_preview_chars
+        if cap:
+            left, right = min(left, cap), min(right, cap)
+        return left, right
+
+    def _load_file_info(self):
+        """Read header metadata and timestamps for both paths and derive the title labels."""
+        self._old_meta, self._old_created = _file_info(self.old_path)
+        self._new_meta, self._new_created = _file_info(self.new_path)
+        self._old_label = self._old_meta.get("cmd") or os.path.basename(self.old_path or "")
+        self._new_label = self._new_meta.get("cmd") or os.path.basename(self.new_path or "")
+        self._titles_stale = True
+
+    def _update_panel_titles(self):
+        """Update panel titles and subtitles with metadata, if it changed since the last write."""
+        if not self._titles_stale:
+            return
+        try:
+            # Labels are plain text appended to the styled prefix: no markup parse or escape
+            left_title = _OLD_TITLE.copy()
+            left_title.append(self._old_label)
+            right_title = _NEW_TITLE.copy()
+            right_title.append(self._new_label)
+            self._lp_title.update(left_title)
+            self._rp_title.update(right_title)
+            self._lp_sub.update(f"Modified: {self._old_created}" if self._old_created else "")
+            self._rp_sub.update(f"Modified: {self._new_created}" if self._new_created else "")
+            self._titles_stale = False
         except (AttributeError, RuntimeError):
             log("Failed to update panel titles and subtitles")
             pass
@@ -937,33 +1395,32 @@ class SideBySideDiffScreen(BaseScreen):
             Tuple of (clamped_left_lines, clamped_right_lines)
         """
 
-        def clamp_line(s: str) -> str:
-            try:
-                if config.max_preview_chars and len(s) > config.max_preview_chars:
-                    return s[: config.max_preview_chars] + " …"
-            except (ValueError, AttributeError):
-                log(f"Failed to clamp line length for: {s[:50]}...")
-                pass
-            return s
+        # Read the cap once; rendered lines are always str, so the slice can't fail
+        cap = config.max_preview_chars
+        if not cap:
+            return left_lines, right_lines
+
+        def clamp(lines: list[str]) -> list[str]:
+            # Most lines fit; return the input untouched unless one overflows.
+            # max(map(len, ...)) runs the whole length scan in C.
+            if max(map(len, lines), default=0) <= cap:
+                return lines
+            keep = cap - _ELLIPSIS_LEN
+            return [s if len(s) <= cap else s[:keep] + _ELLIPSIS for s in lines]
 
-        return [clamp_line(s) for s in left_lines], [clamp_line(s) for s in right_lines]
+        return clamp(left_lines), clamp(right_lines)
 
-    def _update_panel_contents(self, left, right, left_lines: list[str], right_lines: list[str]):
+    def _update_panel_contents(self, left_lines: list[str], right_lines: list[str]):
         """Update the actual panel content widgets with rendered lines.
 
         Args:
-            left: Left panel widget
-            right: Right panel widget
             left_lines: Formatted lines for left panel
             right_lines: Formatted lines for right panel
         """
         try:
-            lp_cont = left.query_one('.file-content', Vertical)
-            rp_cont = right.query_one('.file-content', Vertical)
-            lp_text = lp_cont.query_one('.file-text', Static)
-            rp_text = rp_cont.query_one('.file-text', Static)
-            lp_text.update("\n".join(left_lines))
-            rp_text.update("\n".join(right_lines))
+            left_width, right_width = self._rendered_widths
+            self._lp_text.set_lines(left_lines, left_width)
+            self._rp_text.set_lines(right_lines, right_width)
         except (AttributeError, RuntimeError):
             log("Failed to update diff content panels")
             pass
@@ -2,23 +2,38 @@ from __future__ import annotations
 
 import os
 import re
+from functools import partial
 
-from rich.text import Text
+from rich.cells import cell_len
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.screen import Screen
-from textual.widgets import ListItem, Static
+from textual.widgets import Static
+from textual.worker import get_current_worker
+
+try:
+    # Optional Aho-Corasick keyword matcher (pip install pyahocorasick); the regex is used otherwise
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-from delta_vision.utils.config import config
 from delta_vision.utils.io import read_lines
-from delta_vision.utils.keyword_highlighter import highlighter
 from delta_vision.utils.logger import log
+from delta_vision.utils.text import make_keyword_pattern
 from delta_vision.utils.watchdog import start_observer
+from delta_vision.widgets.diff_lines import DiffLines
 from delta_vision.widgets.footer import Footer
 from delta_vision.widgets.header import Header
 
 from .keywords_parser import parse_keywords_md
 
+_DEFAULT_KW_WRAP = ("[u][yellow]", "[/yellow][/u]")
+_WORD_CHAR = re.compile(r"\w")
+# Command in double quotes on the header line
+_QUOTED_CMD_RE = re.compile(r'"([^"]+)"')
+# Longest file shown in full; longer ones are truncated with a note in the title
+_MAX_VIEWER_LINES = 1_000_000
+
 
 class FileViewerScreen(Screen):
     """Simple file viewer that opens a file and jumps to a specific line."""
@@ -50,18 +65,28 @@ class FileViewerScreen(Screen):
         self.line_no = max(1, int(line_no or 1))
         # UI refs
         self._file_panel = None
+        self._content_view = None
         # Keyword highlighting
         self.keywords_path = keywords_path
         self.keywords_dict = None
         self.keyword_highlight_enabled = keywords_enabled
         # Cached state
         self._display_lines = []
+        self._content_width = 0
         self._keyword_lookup = {}
         self._sorted_keywords = []
+        # One compiled alternation of all keywords, and lowercased keyword -> (open, close) markup
+        self._kw_pattern = None
+        self._kw_wrap = {}
+        self._kw_automaton = None
+        # Rendered content per highlight state, valid while _display_lines is _content_lines
+        self._content_cache = {}
+        self._content_lines = None
+        self._line_prefixes = []
         # Vim-like navigation support (double 'g')
         self._last_g = False
-        # Render limits
-        self._max_render_lines = config.max_render_lines
+        # Render limits: rows render lazily, so only a sanity cap on lines held in memory
+        self._max_render_lines = _MAX_VIEWER_LINES
         # Watchdog observer for live updates
         self._observer = None
         self._stop_observer = None
@@ -85,78 +110,34 @@ class FileViewerScreen(Screen):
         self.app.pop_screen()
 
     async def on_mount(self):
-        content, _enc = read_lines(self.file_path)
-        if not content:
-            content = ["[Error reading file]"]
-
-        # Parse keywords if provided
-        if self.keywords_path and os.path.isfile(self.keywords_path):
-            try:
-                self.keywords_dict = parse_keywords_md(self.keywords_path)
-            except (OSError, ValueError, AttributeError):
-                log(f"Failed to parse keywords file {self.keywords_path}")
-                self.keywords_dict = None
-
-        # Hide the first line (date/command header) from display
-        all_display_lines = content[1:] if len(content) > 0 else []
-        truncated = False
-        if len(all_display_lines) > self._max_render_lines:
-            display_lines = all_display_lines[: self._max_render_lines]
-            truncated = True
-        else:
-            display_lines = all_display_lines
-        self._display_lines = display_lines
+        title_text = self._load_file()
 
-        # Build keyword caches
-        self._keyword_lookup = {}
-        if self.keywords_dict:
-            for _cat, (color, words) in self.keywords_dict.items():
-                for w in words:
-                    self._keyword_lookup[w] = color
-        self._sorted_keywords = (
-            sorted(self._keyword_lookup.keys(), key=len, reverse=True) if self._keyword_lookup else []
-        )
-
-        # Create title from header line (between quotes) - exactly like stream screen
-        header_line = content[0] if content else ""
-        cmd_match = re.search(r'"([^"]+)"', header_line) if header_line else None
-        title_text = cmd_match.group(1) if cmd_match else self.page_name
-
-        # Add truncation info to the title if needed
-        if truncated:
-            total = len(all_display_lines)
-            shown = len(display_lines)
-            title_text = f"{title_text} (Showing {shown} of {total} lines)"
-
-        # Create content with line numbers - exactly like stream screen
-        content_lines = []
-        for i, line in enumerate(display_lines):
-            # Create display content with line numbers
-            line_display = f"{i + 2:4}│ {line}"
-
-            # Apply keyword highlighting if enabled
-            if self.keyword_highlight_enabled and self._sorted_keywords:
-                line_display = self._apply_keyword_highlighting(line_display)
-
-            content_lines.append(line_display)
-
-        content_with_numbers = "\n".join(content_lines)
+        # Create content with line numbers - exactly like stream screen. Show the
+        # plain lines first; keyword highlighting of a large file follows from a worker.
+        content_lines = self._build_content(self._display_lines, False)
+        self._cache_content(self._display_lines, False, content_lines)
 
         # Get the scroll container and mount the file panel - exactly like stream screen
         try:
             scroll_container = self.query_one('#viewer-main-scroll')
 
-            # Create file panel with same structure as stream screen
+            # Create file panel with same structure as stream screen. The content
+            # panel only renders rows as they scroll into view, so mount cost does
+            # not grow with the file.
+            self._content_view = DiffLines(classes="file-content")
             file_panel = Vertical(
                 Static(title_text, classes="file-command"),
-                Static(content_with_numbers, classes="file-content", markup=True),
+                self._content_view,
                 classes="file-panel",
             )
 
-            scroll_container.mount(file_panel)
+            await scroll_container.mount(file_panel)
             self._file_panel = file_panel
+            self._content_view.set_lines(content_lines, self._content_width)
         except Exception as e:
             log(f"Failed to create file panel: {e}")
+        if self.keyword_highlight_enabled:
+            self._repaint_highlighting()
 
         # Start watchdog observer for live updates
         self._start_file_observer()
@@ -182,90 +163,65 @@ class FileViewerScreen(Screen):
             self._observer = None
             self._stop_observer = None
 
-    def refresh_file(self):
-        """Refresh the file viewer when the file changes."""
-        # Store current selection index for restoration
-        current_index = 0
-        try:
-            if self._list:
-                current_index = getattr(self._list, 'index', 0) or 0
-        except (AttributeError, RuntimeError):
-            log("Failed to capture current list index")
-
-        # Re-read file and rebuild view
-        try:
-            content, _enc = read_lines(self.file_path)
-            if not content:
-                content = ["[Error reading file]"]
-
-            # Parse keywords if provided
-            if self.keywords_path and os.path.isfile(self.keywords_path):
-                try:
-                    self.keywords_dict = parse_keywords_md(self.keywords_path)
-                except (OSError, ValueError, AttributeError):
-                    log(f"Failed to parse keywords file {self.keywords_path}")
-                    self.keywords_dict = None
-
-            # Hide the first line (date/command header) from display
-            all_display_lines = content[1:] if len(content) > 0 else []
-            truncated = False
-            if len(all_display_lines) > self._max_render_lines:
-                display_lines = all_display_lines[: self._max_render_lines]
-                truncated = True
-            else:
-                display_lines = all_display_lines
-            self._display_lines = display_lines
+    def _load_file(self) -> str:
+        """Read the file and keywords into the display caches; return the panel title."""
+        content, _enc = read_lines(self.file_path)
+        if not content:
+            content = ["[Error reading file]"]
 
-            # Update title with command from header line (between quotes)
+        # Parse keywords if provided
+        if self.keywords_path and os.path.isfile(self.keywords_path):
             try:
-                title_widget = self.query_one('#viewer-title', Static)
-                subtitle_widget = self.query_one('#viewer-subtitle', Static)
-                header_line = content[0] if content else ""
-                cmd_match = re.search(r'"([^"]+)"', header_line) if header_line else None
-                title_text = cmd_match.group(1) if cmd_match else self.viewer_title
-                title_widget.update(title_text)
-                if truncated:
-                    total = len(all_display_lines)
-                    shown = len(display_lines)
-                    subtitle_widget.update(f"Showing {shown} of {total} lines (truncated)")
-                else:
-                    subtitle_widget.update("")
-            except (AttributeError, RuntimeError):
-                log("Failed to update title and subtitle widgets")
-
-            if self._list is not None:
-                try:
-                    self._list.clear()
-                except (AttributeError, RuntimeError):
-                    log("Failed to clear list widget")
-
-                # Build keyword caches
-                self._keyword_lookup = {}
-                if self.keywords_dict:
-                    for _cat, (color, words) in self.keywords_dict.items():
-                        for w in words:
-                            self._keyword_lookup[w] = color
-                self._sorted_keywords = sorted(self._keyword_lookup.keys(), key=len, reverse=True)
-
-                # Build line widgets and keep references for smooth repaint
-                self._line_widgets = []
-                for i, line in enumerate(self._display_lines):
-                    markup = self._render_markup_for_line(i, line)
-                    static = Static(Text.from_markup(markup))
-                    self._line_widgets.append(static)
-                    self._list.append(ListItem(static))
-
-                # Restore selection/scroll to preserved position
-                try:
-                    # Ensure the index is within bounds
-                    max_index = len(self._display_lines) - 1
-                    restore_index = min(current_index, max_index) if max_index >= 0 else 0
-                    self._list.index = restore_index
-                except (AttributeError, ValueError, IndexError):
-                    log(f"Failed to restore list index to {current_index}")
+                self.keywords_dict = parse_keywords_md(self.keywords_path)
+            except (OSError, ValueError, AttributeError):
+                log(f"Failed to parse keywords file {self.keywords_path}")
+                self.keywords_dict = None
 
+        # Hide the first line (date/command header) from display
+        all_display_lines = content[1:] if len(content) > 0 else []
+        truncated = False
+        if len(all_display_lines) > self._max_render_lines:
+            display_lines = all_display_lines[: self._max_render_lines]
+            truncated = True
+        else:
+            display_lines = all_display_lines
+        self._display_lines = display_lines
+        # Widest row in cells: the line-number gutter plus the widest line
+        gutter = len(f"{len(display_lines) + 1:4}│ ")
+        self._content_width = max(map(cell_len, display_lines), default=0) + gutter
+
+        # Build keyword caches
+        self._build_keyword_caches()
+
+        # Create title from header line (between quotes) - exactly like stream screen
+        header_line = content[0] if content else ""
+        cmd_match = _QUOTED_CMD_RE.search(header_line) if header_line else None
+        title_text = cmd_match.group(1) if cmd_match else self.page_name
+
+        # Add truncation info to the title if needed
+        if truncated:
+            total = len(all_display_lines)
+            shown = len(display_lines)
+            title_text = f"{title_text} (Showing {shown} of {total} lines)"
+        return title_text
+
+    def refresh_file(self):
+        """Refresh the file viewer when the file changes."""
+        if self._file_panel is None:
+            return
+        try:
+            title_text = self._load_file()
         except (OSError, RuntimeError) as e:
             log(f"Failed to refresh file viewer: {e}")
+            return
+
+        # Update the mounted panel in place rather than remounting, which also
+        # keeps the scroll position
+        try:
+            self._file_panel.query_one('.file-command', Static).update(title_text)
+        except (AttributeError, RuntimeError):
+            log("Failed to update file viewer title")
+        self._repaint_highlighting()
 
     def on_unmount(self):
         """Stop observer when leaving the screen."""
@@ -279,31 +235,13 @@ class FileViewerScreen(Screen):
         # Preserve only double-"g" go-to-top behavior here; other keys are actions
         key = getattr(event, 'key', None)
         if key == 'g':
-            lv = self._list
-            if not lv:
-                return
-            self.safe_set_focus(lv)
             try:
                 event.stop()
             except AttributeError:
                 log("Failed to stop event")
                 pass
-            # no-op read of index removed (was unused)
-            total = len(self._display_lines) if self._display_lines else 0
-
-            def set_index(i: int):
-                try:
-                    lv.index = i
-                    scroll_to_index = getattr(lv, 'scroll_to_index', None)
-                    if callable(scroll_to_index):
-                        scroll_to_index(i)
-                except (AttributeError, ValueError, IndexError):
-                    log(f"Failed to set list index to {i}")
-                    pass
-
             if self._last_g:
-                if total:
-                    set_index(0)
+                self._scroll_content("scroll_home")
                 self._last_g = False
             else:
                 self._last_g = True
@@ -311,32 +249,27 @@ class FileViewerScreen(Screen):
         else:
             self._last_g = False
 
+    def _scroll_content(self, method_name: str):
+        """Call a scroll method on the content panel, which scrolls the file itself."""
+        try:
+            getattr(self._content_view, method_name)(animate=False)
+        except (AttributeError, RuntimeError) as e:
+            log(f"Failed to {method_name.replace('_', ' ')}: {e}")
+
     # --- Actions for help/discoverability ---
     def action_next_line(self):
         """Scroll down by one line."""
-        try:
-            scroll_container = self.query_one('#viewer-main-scroll')
-            scroll_container.scroll_down(animate=False)
-        except Exception as e:
-            log(f"Failed to scroll down: {e}")
+        self._scroll_content("scroll_down")
         self._last_g = False
 
     def action_prev_line(self):
         """Scroll up by one line."""
-        try:
-            scroll_container = self.query_one('#viewer-main-scroll')
-            scroll_container.scroll_up(animate=False)
-        except Exception as e:
-            log(f"Failed to scroll up: {e}")
+        self._scroll_content("scroll_up")
         self._last_g = False
 
     def action_end(self):
         """Scroll to the end of the content."""
-        try:
-            scroll_container = self.query_one('#viewer-main-scroll')
-            scroll_container.scroll_end(animate=False)
-        except Exception as e:
-            log(f"Failed to scroll to end: {e}")
+        self._scroll_content("scroll_end")
         self._last_g = False
 
     def action_toggle_keywords(self):
@@ -355,53 +288,143 @@ class FileViewerScreen(Screen):
         except Exception as e:
             log(f"Failed to update footer: {e}")
 
-    def _render_markup_for_line(self, i: int, line: str) -> str:
-        disp_num = i + 1
-        orig_idx = i + 2
-        left = f"[dim]{disp_num:>6} │ [/dim]"
-        content = line
-        if self.keyword_highlight_enabled and self._sorted_keywords:
-            # Use centralized keyword highlighter with the sorted keywords and color lookup
-            content = highlighter.highlight_with_color_lookup(
-                line=content, keywords=self._sorted_keywords, color_lookup=self._keyword_lookup, case_sensitive=False
-            )
-        if orig_idx == self.line_no:
-            content = f"[on grey23]{content}[/on grey23]"
-        return left + content
+    def _build_content(self, lines: list[str], highlight: bool) -> list[str]:
+        """Return the numbered markup lines of the file for one highlight state."""
+        # Line-number gutters only depend on the line count; reuse them across rebuilds
+        prefixes = self._line_prefixes
+        if len(prefixes) < len(lines):
+            # Numbers start at 2: the header line is hidden
+            prefixes = self._line_prefixes = [f"{i:4}│ " for i in range(2, len(lines) + 2)]
+        content_lines = [p + line for p, line in zip(prefixes, lines)]
+        if highlight and self._sorted_keywords:
+            content_lines = list(map(self._apply_keyword_highlighting, content_lines))
+        return content_lines
 
     def _repaint_highlighting(self):
-        """Update highlighting in the content Static widget."""
+        """Update highlighting in the content panel."""
         try:
-            if not hasattr(self, '_file_panel') or not hasattr(self, '_display_lines'):
+            if self._file_panel is None:
                 return
 
-            # Regenerate content with current keyword highlighting state
-            content_lines = []
-            for i, line in enumerate(self._display_lines):
-                # Create display content with line numbers
-                line_display = f"{i + 2:4}│ {line}"
-
-                # Apply keyword highlighting if enabled
-                if self.keyword_highlight_enabled and self._sorted_keywords:
-                    line_display = self._apply_keyword_highlighting(line_display)
-
-                content_lines.append(line_display)
+            lines = self._display_lines
+            highlight = self.keyword_highlight_enabled
+            if self._content_lines is lines and highlight in self._content_cache:
+                # Toggling back to a state already rendered for this file: just swap it in
+                self._apply_content(lines, highlight, self._content_cache[highlight])
+            elif highlight and self._sorted_keywords:
+                # Keyword passes over a large file would stall input; run them off the event loop
+                self.run_worker(
+                    partial(self._highlight_content_worker, lines, highlight),
+                    group="highlight",
+                    exclusive=True,
+                    thread=True,
+                    exit_on_error=False,
+                )
+            else:
+                self._apply_content(lines, highlight, self._build_content(lines, highlight))
 
-            content_with_numbers = "\n".join(content_lines)
+        except (AttributeError, RuntimeError) as e:
+            log(f"Failed to repaint highlighting: {e}")
+            pass
 
-            # Update the file-content Static widget
-            content_widget = self._file_panel.query_one('.file-content', Static)
-            content_widget.update(content_with_numbers)
+    def _highlight_content_worker(self, lines: list[str], highlight: bool):
+        """Build highlighted content for ``lines``; runs in a worker thread."""
+        worker = get_current_worker()
+        try:
+            content = self._build_content(lines, highlight)
+        except Exception as e:
+            # The worker runs with exit_on_error=False: log here or the failure is silent
+            log(f"Failed to highlight file content: {e}")
+            return
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._apply_content, lines, highlight, content)
 
+    def _apply_content(self, lines: list[str], highlight: bool, content: list[str]):
+        """Show ``content`` if it still matches the file and toggle state; runs on the event loop."""
+        if lines is not self._display_lines:
+            # The file was reloaded while rendering
+            return
+        self._cache_content(lines, highlight, content)
+        if highlight != self.keyword_highlight_enabled:
+            # The toggle flipped again while rendering
+            return
+        try:
+            self._content_view.set_lines(content, self._content_width)
         except (AttributeError, ValueError, IndexError, UnicodeError) as e:
             log(f"Failed to repaint highlighting: {e}")
-            pass
 
-    def _apply_keyword_highlighting(self, text: str) -> str:
-        """Apply keyword highlighting to text using the centralized highlighter."""
-        if not self.keywords_dict or not self._sorted_keywords:
-            return text
+    def _cache_content(self, lines: list[str], highlight: bool, content: list[str]):
+        """Remember ``content`` for ``highlight``, dropping renders of a previous file load."""
+        if self._content_lines is not lines:
+            self._content_lines = lines
+            self._content_cache = {}
+        self._content_cache[highlight] = content
 
-        return highlighter.highlight_with_color_lookup(
-            text, self._sorted_keywords, self._keyword_lookup, case_sensitive=False
+    def _build_keyword_caches(self):
+        """Rebuild the keyword lookups and the combined keyword pattern from ``keywords_dict``."""
+        self._keyword_lookup = {}
+        if self.keywords_dict:
+            for _cat, (color, words) in self.keywords_dict.items():
+                for w in words:
+                    self._keyword_lookup[w] = color
+        self._sorted_keywords = (
+            sorted(self._keyword_lookup.keys(), key=len, reverse=True) if self._keyword_lookup else []
         )
+        # Matches are case-insensitive; keywords differing only in case take the first color
+        self._kw_wrap = {}
+        for kw in self._sorted_keywords:
+            key = kw.strip().lower()
+            if key:
+                c = self._keyword_lookup[kw].lower()
+                self._kw_wrap.setdefault(key, (f"[u][{c}]", f"[/{c}][/u]"))
+        self._kw_pattern = make_keyword_pattern(self._sorted_keywords, whole_word=True, case_insensitive=True)
+        self._kw_automaton = None
+        if ahocorasick is not None and self._kw_wrap:
+            automaton = ahocorasick.Automaton()
+            for key, wrap in self._kw_wrap.items():
+                automaton.add_word(key, (len(key), wrap))
+            automaton.make_automaton()
+            self._kw_automaton = automaton
+
+    def _wrap_keyword(self, match: re.Match) -> str:
+        matched = match.group(1)
+        open_, close_ = self._kw_wrap.get(matched.lower(), _DEFAULT_KW_WRAP)
+        return f"{open_}{matched}{close_}"
+
+    def _highlight_with_automaton(self, text: str) -> str:
+        """Highlight keywords in one automaton pass, matching what ``_kw_pattern.sub`` would produce."""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing shifted offsets (e.g. "İ"); let the regex handle this line
+            return self._kw_pattern.sub(self._wrap_keyword, text)
+        is_word = _WORD_CHAR.match
+        n = len(text)
+        # Longest whole-word keyword starting at each position
+        best: dict[int, tuple[int, tuple[str, str]]] = {}
+        for end, (length, wrap) in self._kw_automaton.iter(lowered):
+            start = end - length + 1
+            if (start and is_word(text, start - 1)) or (end + 1 < n and is_word(text, end + 1)):
+                continue
+            if start not in best or best[start][0] < length:
+                best[start] = (length, wrap)
+        if not best:
+            return text
+        # Take matches leftmost first, skipping any that overlap one already taken
+        parts: list[str] = []
+        pos = 0
+        for start in sorted(best):
+            if start < pos:
+                continue
+            length, (open_, close_) = best[start]
+            parts += (text[pos:start], open_, text[start : start + length], close_)
+            pos = start + length
+        parts.append(text[pos:])
+        return "".join(parts)
+
+    def _apply_keyword_highlighting(self, text: str) -> str:
+        """Apply keyword highlighting to text in one pass of the combined keyword pattern."""
+        if not self.keywords_dict or self._kw_pattern is None:
+            return text
+        if self._kw_automaton is not None:
+            return self._highlight_with_automaton(text)
+        return self._kw_pattern.sub(self._wrap_keyword, text)
@@ -35,6 +35,9 @@ from .watchdog_helper import start_watchdog
 
 # KeywordProcessor functionality moved to utils/keyword_highlighter.py for reuse across screens
 
+# Command in double quotes on a file's header line
+_QUOTED_CMD_RE = re.compile(r'"([^"]+)"')
+
 
 class StreamScreen(BaseScreen):
     """Live stream of files in a folder with optional keyword filtering.
@@ -333,7 +336,7 @@ class StreamScreen(BaseScreen):
 
         # Extract the actual command (after timestamp if present)
         # Format: "timestamp "command"" or just "command"
-        command_match = re.search(r'"([^"]+)"', first_line)
+        command_match = _QUOTED_CMD_RE.search(first_line)
         if command_match:
             command_text = command_match.group(1)
             title = command_text  # Use command as title too
@@ -1,16 +1,21 @@
 """Diff computation utilities for Delta Vision.
 
-This module provides text comparison functionality using Python's difflib
-to generate line-by-line diff data suitable for UI rendering.
+This module provides line-by-line diff data suitable for UI rendering. Lines
+are compared with Myers' O(ND) algorithm, which is fast when the two sides
+differ in few lines; heavily rewritten files fall back to Python's difflib.
 """
 
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 
 from .io import safe_read_lines
 
+# Edit distance past which Myers' quadratic-in-D bookkeeping costs more than
+# difflib; larger diffs are handed to SequenceMatcher instead
+_MYERS_MAX_D = 500
+
 
 class DiffType(Enum):
     """Enumeration of diff row types."""
@@ -25,6 +30,10 @@ class DiffType(Enum):
 class DiffRow:
     """Represents a single row in a diff comparison."""
 
+    # Diffs hold one row per line; slots drop the per-row __dict__ and speed up
+    # the attribute reads in the render loop (dataclass(slots=True) needs 3.10)
+    __slots__ = ("diff_type", "left_line_num", "right_line_num", "left_content", "right_content")
+
     diff_type: DiffType
     left_line_num: Optional[int]
     right_line_num: Optional[int]
@@ -46,9 +55,13 @@ def compute_diff_rows(old_input, new_input) -> list[DiffRow]:
     old_lines = _get_lines_from_input(old_input)
     new_lines = _get_lines_from_input(new_input)
 
+    if old_lines is new_lines or old_lines == new_lines:
+        # Nothing to diff (e.g. a pair pointing at one file): every line is unchanged
+        return [DiffRow(DiffType.UNCHANGED, num, num, line, line) for num, line in enumerate(old_lines, 1)]
+
     state = _initialize_diff_state(old_lines, new_lines)
 
-    for opcode in state["matcher"].get_opcodes():
+    for opcode in _diff_opcodes(old_lines, new_lines):
         _process_opcode(opcode, state)
 
     return state["rows"]
@@ -73,11 +86,120 @@ def _get_lines_from_input(input_data):
         return []  # Fallback for unexpected input types
 
 
+def common_affixes(a: list, b: list) -> tuple[int, int]:
+    """Return the lengths of the shared prefix and suffix of ``a`` and ``b``.
+
+    The suffix never overlaps the prefix, so both fit within the shorter list.
+    """
+    limit = min(len(a), len(b))
+    pre = 0
+    while pre < limit and a[pre] == b[pre]:
+        pre += 1
+    suf = 0
+    limit -= pre
+    while suf < limit and a[-1 - suf] == b[-1 - suf]:
+        suf += 1
+    return pre, suf
+
+
+def _diff_opcodes(old_lines: list[str], new_lines: list[str]) -> list[tuple]:
+    """Return difflib-style opcodes turning ``old_lines`` into ``new_lines``."""
+    n, m = len(old_lines), len(new_lines)
+    # Only the middle between the shared head and tail needs diffing
+    pre, suf = common_affixes(old_lines, new_lines)
+    old_mid = old_lines[pre : n - suf]
+    new_mid = new_lines[pre : m - suf]
+    # Number each distinct line once so the inner loop compares ints, not strings
+    ids: dict[str, int] = {}
+    a = [ids.setdefault(line, len(ids)) for line in old_mid]
+    b = [ids.setdefault(line, len(ids)) for line in new_mid]
+    middle = myers_opcodes(a, b, _MYERS_MAX_D)
+    if middle is None:
+        middle = SequenceMatcher(None, old_mid, new_mid, autojunk=False).get_opcodes()
+
+    opcodes = [("equal", 0, pre, 0, pre)] if pre else []
+    opcodes.extend((tag, i1 + pre, i2 + pre, j1 + pre, j2 + pre) for tag, i1, i2, j1, j2 in middle)
+    if suf:
+        opcodes.append(("equal", n - suf, n, m - suf, m))
+    return opcodes
+
+
+def myers_opcodes(a: Sequence, b: Sequence, max_d: int) -> Optional[list[tuple]]:
+    """Diff two sequences with Myers' O(ND) algorithm.
+
+    Returns opcodes in ``SequenceMatcher.get_opcodes()`` form, with each
+    run of deletions and insertions between equal blocks reported as one
+    ``replace``. Returns None if the edit distance exceeds ``max_d``.
+    """
+    n, m = len(a), len(b)
+    max_d = min(max_d, n + m)
+    offset = max_d + 1
+    # v[offset + k] is the furthest x reached on diagonal k = x - y
+    v = [0] * (2 * max_d + 3)
+    # trace[d] holds diagonals -d..d of v after round d, for the backtrack
+    trace: list[list[int]] = []
+    for d in range(max_d + 1):
+        # Walk v by index (i = offset + k) so the hot loop does no offset arithmetic
+        lo, hi = offset - d, offset + d
+        for i in range(lo, hi + 1, 2):
+            if i == lo or (i != hi and v[i - 1] < v[i + 1]):
+                x = v[i + 1]
+            else:
+                x = v[i - 1] + 1
+            y = x - i + offset
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[i] = x
+            if x >= n and y >= m:
+                trace.append(v[lo : hi + 1])
+                return _opcodes_from_trace(trace, n, m)
+        trace.append(v[lo : hi + 1])
+    return None
+
+
+def _opcodes_from_trace(trace: list[list[int]], n: int, m: int) -> list[tuple]:
+    """Walk Myers' trace back from ``(n, m)`` and group the path into opcodes."""
+    # Collect the equal blocks as (i, j, length), last first
+    blocks = []
+    x, y = n, m
+    for d in range(len(trace) - 1, 0, -1):
+        prev = trace[d - 1]
+        k = x - y
+        if k == -d or (k != d and prev[k - 1 + d - 1] < prev[k + 1 + d - 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = prev[prev_k + d - 1]
+        prev_y = prev_x - prev_k
+        # The snake after the edit is a run of equal lines
+        mid_x = prev_x if prev_k == k + 1 else prev_x + 1
+        if x > mid_x:
+            blocks.append((mid_x, mid_x - k, x - mid_x))
+        x, y = prev_x, prev_y
+    if x:
+        blocks.append((0, 0, x))
+    blocks.reverse()
+
+    opcodes = []
+    i = j = 0
+    for bi, bj, size in blocks + [(n, m, 0)]:
+        if i < bi and j < bj:
+            opcodes.append(("replace", i, bi, j, bj))
+        elif i < bi:
+            opcodes.append(("delete", i, bi, j, bj))
+        elif j < bj:
+            opcodes.append(("insert", i, bi, j, bj))
+        if size:
+            opcodes.append(("equal", bi, bi + size, bj, bj + size))
+        i, j = bi + size, bj + size
+    return opcodes
+
+
 def _initialize_diff_state(old_lines: list[str], new_lines: list[str]) -> dict:
     """Initialize state for diff computation."""
     return {
         "rows": [],
-        "matcher": SequenceMatcher(None, old_lines, new_lines),
         "old_lines": old_lines,
         "new_lines": new_lines,
         "old_idx": 1,
@@ -10,6 +10,16 @@ from typing import Optional
 
 from .logger import log
 
+# Headers are one short line; never read more than this looking for its end
+_HEADER_READ_LIMIT = 4096
+
+# Header layouts, tried in order (see parse_header_metadata)
+_HEADER_PATTERNS = [
+    re.compile(r"^\s*(\d{8})[ T](\d{6})\s+\"([^\"]+)\""),  # YYYYMMDD HHMMSS "cmd" or YYYYMMDDTHHMMSS "cmd"
+    re.compile(r"^\s*(\d{8})T(\d{6})\s+\"([^\"]+)\""),  # YYYYMMDDTHHMMSS "cmd"
+    re.compile(r"^\s*(\d{8})\s+\"([^\"]+)\""),  # YYYYMMDD "cmd"
+]
+
 
 def read_file_with_fallback(file_path: str, skip_header: bool = True) -> list[str]:
     """Read a file with multiple encoding attempts, optionally skipping header line.
@@ -66,39 +76,52 @@ def read_file_pair(old_path: str, new_path: str) -> tuple[list[str], list[str]]:
     return read_file_with_fallback(old_path), read_file_with_fallback(new_path)
 
 
-def extract_first_line_command(file_path: str) -> Optional[str]:
-    """Extract the quoted command from the first line, if present.
+def _read_header_line(file_path: str) -> Optional[str]:
+    """Return the first line of a file, decoded with encoding fallbacks.
+
+    Reads at most ``_HEADER_READ_LIMIT`` bytes in one open, so a header
+    check costs the same however large the file is.
 
     Args:
         file_path: Path to the file to read
 
     Returns:
-        The command string extracted from quotes, or None if not found
+        The first line without its line ending, or None if the file can't be read
     """
-    if not file_path or not os.path.isfile(file_path):
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.readline(_HEADER_READ_LIMIT)
+    except (OSError, PermissionError):
+        log(f"Failed to read header from {file_path}")
         return None
 
-    # Try multiple encodings for just the first line
-    first_line = None
     for enc in ("utf-8", "utf-8-sig", "cp1252", "latin-1"):
         try:
-            with open(file_path, encoding=enc, errors="strict") as f:
-                first_line = f.readline()
+            text = raw.decode(enc)
             break
         except UnicodeDecodeError:
             continue
-        except (OSError, PermissionError):
-            log(f"Failed to read first line from {file_path} with encoding {enc}")
-            return None
+    else:
+        text = raw.decode("utf-8", errors="ignore")
+    lines = text.splitlines()
+    return lines[0] if lines else ""
+
+
+def extract_first_line_command(file_path: str) -> Optional[str]:
+    """Extract the quoted command from the first line, if present.
 
-    # Fallback with error ignoring
+    Args:
+        file_path: Path to the file to read
+
+    Returns:
+        The command string extracted from quotes, or None if not found
+    """
+    if not file_path or not os.path.isfile(file_path):
+        return None
+
+    first_line = _read_header_line(file_path)
     if first_line is None:
-        try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                first_line = f.readline()
-        except (OSError, PermissionError):
-            log(f"Failed to read first line from {file_path} with fallback encoding")
-            return None
+        return None
 
     # Extract command from first to last quotes
     match = re.search(r'"(.*)"', first_line or "")
@@ -125,26 +148,7 @@ def parse_header_metadata(file_path: str) -> Optional[dict[str, Optional[str]]]:
         return None
 
     # Read first line with encoding fallbacks
-    first_line = None
-    for enc in ("utf-8", "utf-8-sig", "cp1252", "latin-1"):
-        try:
-            with open(file_path, encoding=enc, errors="strict") as f:
-                first_line = f.readline()
-            break
-        except UnicodeDecodeError:
-            continue
-        except (OSError, PermissionError):
-            log(f"Failed to read header from {file_path} with encoding {enc}")
-            break
-
-    # Fallback encoding with error ignoring
-    if first_line is None:
-        try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                first_line = f.readline()
-        except (OSError, PermissionError):
-            log(f"Failed to read header from {file_path} with fallback encoding")
-            first_line = ""
+    first_line = _read_header_line(file_path) or ""
 
     # Initialize return values
     date = None
@@ -152,14 +156,8 @@ def parse_header_metadata(file_path: str) -> Optional[dict[str, Optional[str]]]:
     cmd = None
 
     # Try multiple header patterns
-    patterns = [
-        r"^\s*(\d{8})[ T](\d{6})\s+\"([^\"]+)\"",  # YYYYMMDD HHMMSS "cmd" or YYYYMMDDTHHMMSS "cmd"
-        r"^\s*(\d{8})T(\d{6})\s+\"([^\"]+)\"",  # YYYYMMDDTHHMMSS "cmd"
-        r"^\s*(\d{8})\s+\"([^\"]+)\"",  # YYYYMMDD "cmd"
-    ]
-
-    for pattern in patterns:
-        match = re.match(pattern, first_line or "")
+    for pattern in _HEADER_PATTERNS:
+        match = pattern.match(first_line)
         if match:
             groups = match.groups()
             if len(groups) == 3:
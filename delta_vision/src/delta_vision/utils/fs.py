@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
+from functools import lru_cache
 
 from delta_vision.utils.logger import log
 
@@ -38,13 +39,22 @@ def minutes_between(a: str, b: str) -> int | None:
         return None
 
 
-def format_mtime(path: str, fmt: str = "%Y-%m-%d %H:%M:%S") -> str | None:
-    """Format file mtime as a human string, or None on error."""
-    ts = get_mtime(path)
+def format_mtime(path: str, fmt: str = "%Y-%m-%d %H:%M:%S", mtime: float | None = None) -> str | None:
+    """Format file mtime as a human string, or None on error.
+
+    Callers that already hold a stat result can pass ``mtime`` to skip the lookup.
+    """
+    ts = mtime if mtime is not None else get_mtime(path)
     if ts is None:
         return None
     try:
-        return datetime.fromtimestamp(ts).strftime(fmt)
+        return _format_timestamp(ts, fmt)
     except (ValueError, OSError) as e:
         log(f"[FS] Failed to format mtime for {path}: {e}")
         return None
+
+
+@lru_cache(maxsize=512)
+def _format_timestamp(ts: float, fmt: str) -> str:
+    """Format a timestamp; unchanged files keep their mtime, so repeats hit the cache."""
+    return datetime.fromtimestamp(ts).strftime(fmt)
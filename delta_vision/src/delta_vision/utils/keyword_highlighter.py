@@ -7,6 +7,7 @@ across different screens for consistent text highlighting behavior.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from rich.markup import escape
 
@@ -14,6 +15,16 @@ from .logger import log
 from .text import make_keyword_pattern
 
 
+@lru_cache(maxsize=64)
+def _matches_survive_escape(pattern: re.Pattern) -> bool:
+    """Whether ``pattern`` can run on ``escape()``-d text and match what it matches on the raw text.
+
+    Without backslashes in the line, ``escape`` only inserts a backslash before
+    tag-like ``[``, so keywords containing neither ``[`` nor ``\\`` are unaffected.
+    """
+    return "\\[" not in pattern.pattern and "\\\\" not in pattern.pattern
+
+
 class KeywordHighlighter:
     """Centralized keyword highlighting with caching and consistent styling."""
 
@@ -35,8 +46,11 @@ class KeywordHighlighter:
             Tuple of (compiled_pattern, keyword_lookup) where keyword_lookup maps
             keyword -> (color, category)
         """
-        # Check if we can reuse cached pattern
-        if keywords_dict == self._last_keywords_dict and self._cached_pattern is not None:
+        # Check if we can reuse cached pattern; screens pass the same dict on every
+        # render, so the identity check usually spares the deep comparison
+        if self._cached_pattern is not None and (
+            keywords_dict is self._last_keywords_dict or keywords_dict == self._last_keywords_dict
+        ):
             return self._cached_pattern, self._cached_lookup
 
         # Build new pattern and lookup
@@ -82,6 +96,19 @@ class KeywordHighlighter:
         if not pattern:
             return escape(line)
 
+        if "\\" not in line and ("[" not in line or _matches_survive_escape(pattern)):
+            # Without backslashes the line can be escaped up front (a no-op when it
+            # has no "[" either), so a single re.sub pass can wrap every keyword
+            # without slicing and escaping the text between matches
+            def wrap(match: re.Match) -> str:
+                matched = match.group(0)
+                color = keyword_lookup.get(matched.lower(), ("yellow", ""))[0].lower()
+                if underline:
+                    return f"[u][{color}]{matched}[/{color}][/u]"
+                return f"[{color}]{matched}[/{color}]"
+
+            return pattern.sub(wrap, escape(line) if "[" in line else line)
+
         out = []
         last = 0
         for match in pattern.finditer(line):
@@ -15,6 +15,9 @@ from typing import Iterator
 from .io import read_text
 from .logger import log
 
+# Command in double quotes on a file's header line
+_QUOTED_CMD_RE = re.compile(r'"([^"]+)"')
+
 
 @dataclass
 class SearchMatch:
@@ -142,7 +145,7 @@ class SearchEngine:
             if text:
                 first_line = text.splitlines()[0]
                 # Look for command in quotes
-                match = re.search(r'"([^"]+)"', first_line)
+                match = _QUOTED_CMD_RE.search(first_line)
                 return match.group(1) if match else first_line.strip()
         except (UnicodeError, ValueError, IndexError) as e:
             log(f"Failed to extract command from {file_path}: {e}")
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from rich.errors import MarkupError
+from rich.text import Text
+from textual.cache import LRUCache
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+
+class DiffLines(ScrollView):
+    """A scrollable panel of Rich-markup lines that only renders visible rows.
+
+    Lines are kept as markup strings; each one is parsed and rendered into a
+    ``Strip`` the first time it scrolls into view, so the cost of a repaint
+    depends on the viewport height rather than the length of the diff.
+    """
+
+    def __init__(self, *, classes: str | None = None, id: str | None = None) -> None:
+        super().__init__(classes=classes, id=id)
+        self._lines: list[str] = []
+        self._strip_cache: LRUCache[int, Strip] = LRUCache(1024)
+
+    def set_lines(self, lines: list[str], width: int) -> None:
+        """Replace the displayed lines.
+
+        Args:
+            lines: One Rich-markup string per row
+            width: Widest row in cells, used for horizontal scrolling
+        """
+        if width == self.virtual_size.width and (lines is self._lines or lines == self._lines):
+            # Same content handed back (e.g. a no-op refresh): cached strips are still valid
+            return
+        self._lines = lines
+        self._strip_cache.clear()
+        self.virtual_size = Size(width, len(lines))
+        self.refresh()
+
+    def notify_style_update(self) -> None:
+        """Drop cached strips when the widget's base style changes."""
+        super().notify_style_update()
+        self._strip_cache.clear()
+
+    def render_line(self, y: int) -> Strip:
+        """Render the row at viewport offset ``y``."""
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.scrollable_content_region.width
+        index = scroll_y + y
+        if index >= len(self._lines):
+            return Strip.blank(width, self.rich_style)
+
+        strip = self._strip_cache.get(index)
+        if strip is None:
+            strip = self._render_row(self._lines[index])
+            self._strip_cache[index] = strip
+        return strip.crop_extend(scroll_x, scroll_x + width, self.rich_style)
+
+    def _render_row(self, markup: str) -> Strip:
+        try:
+            text = Text.from_markup(markup, end="")
+        except MarkupError:
+            # A clamped line may end mid-tag; show it literally rather than fail
+            text = Text(markup, end="")
+        text.no_wrap = True
+        text.stylize_before(self.rich_style)
+        return Strip(text.render(self.app.console), text.cell_len)
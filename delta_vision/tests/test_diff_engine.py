@@ -11,7 +11,7 @@ from unittest.mock import patch
 
 import pytest
 
-from delta_vision.utils.diff_engine import DiffRow, DiffType, compute_diff_rows
+from delta_vision.utils.diff_engine import DiffRow, DiffType, compute_diff_rows, myers_opcodes
 
 
 class TestDiffRow:
@@ -507,3 +507,47 @@ class TestComputeDiffRows:
             assert results[0][i].diff_type == results[1][i].diff_type == results[2][i].diff_type
             assert results[0][i].left_content == results[1][i].left_content == results[2][i].left_content
             assert results[0][i].right_content == results[1][i].right_content == results[2][i].right_content
+
+    def test_diff_line_lists_pair_changed_lines(self):
+        """Test that a changed line between equal lines is reported as one modified row."""
+        old_lines = ["a", "b", "c", "d"]
+        new_lines = ["a", "B", "c", "d", "e"]
+
+        diff_rows = compute_diff_rows(old_lines, new_lines)
+
+        assert [row.diff_type for row in diff_rows] == [
+            DiffType.UNCHANGED,
+            DiffType.MODIFIED,
+            DiffType.UNCHANGED,
+            DiffType.UNCHANGED,
+            DiffType.ADDED,
+        ]
+        assert (diff_rows[1].left_content, diff_rows[1].right_content) == ("b", "B")
+        assert (diff_rows[4].left_line_num, diff_rows[4].right_line_num) == (None, 5)
+
+    def test_diff_rows_cover_both_sides(self):
+        """Test that rows reproduce both inputs, including rewrites past the Myers limit."""
+        base = [f"line {i}" for i in range(300)]
+        cases = [
+            (base, base[:100] + ["inserted"] + base[100:250] + base[260:]),
+            (base, [f"other {i}" for i in range(400)]),
+        ]
+        for old_lines, new_lines in cases:
+            diff_rows = compute_diff_rows(old_lines, new_lines)
+
+            assert [r.left_content for r in diff_rows if r.left_line_num is not None] == old_lines
+            assert [r.right_content for r in diff_rows if r.right_line_num is not None] == new_lines
+
+    def test_myers_opcodes_on_tokens(self):
+        """Test Myers opcodes rebuild the new sequence and give up past max_d."""
+        old = ["def", " ", "foo", "(", "a", ")", ":"]
+        new = ["def", " ", "bar", "(", "a", ",", " ", "b", ")", ":"]
+
+        opcodes = myers_opcodes(old, new, 64)
+
+        rebuilt = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            rebuilt.extend(old[i1:i2] if tag == "equal" else new[j1:j2])
+        assert rebuilt == new
+        assert ("equal", 3, 5, 3, 5) in opcodes
+        assert myers_opcodes(old, new, 2) is None
@@ -0,0 +1,71 @@
+"""Tests for the DiffLines virtualized line panel."""
+
+import pytest
+from textual.app import App, ComposeResult
+
+from delta_vision.widgets.diff_lines import DiffLines
+
+
+class LinesApp(App):
+    """App with a single fixed-size DiffLines panel."""
+
+    CSS = """
+    DiffLines {
+        width: 20;
+        height: 5;
+        scrollbar-size: 0 0;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        yield DiffLines(id="lines")
+
+
+class TestDiffLines:
+    """Test DiffLines caching, cropping and markup fallback."""
+
+    @pytest.mark.asyncio
+    async def test_set_lines_keeps_cache_for_same_content(self):
+        """Test handing back the same lines keeps cached strips, new lines drop them."""
+        async with LinesApp().run_test() as pilot:
+            view = pilot.app.query_one(DiffLines)
+            lines = ["[red]one[/red]", "two"]
+            view.set_lines(lines, 10)
+            await pilot.pause()
+            view.render_line(0)
+            assert 0 in view._strip_cache
+
+            view.set_lines(list(lines), 10)
+            assert view._lines is lines
+            assert 0 in view._strip_cache
+
+            view.set_lines(["three"], 10)
+            assert 0 not in view._strip_cache
+            assert view.virtual_size.width == 10
+            assert view.virtual_size.height == 1
+
+    @pytest.mark.asyncio
+    async def test_render_line_crops_to_horizontal_scroll(self):
+        """Test rows are cropped to the viewport at the current horizontal offset."""
+        async with LinesApp().run_test() as pilot:
+            view = pilot.app.query_one(DiffLines)
+            row = "".join(str(i % 10) for i in range(40))
+            view.set_lines([row], len(row))
+            await pilot.pause()
+            width = view.scrollable_content_region.width
+            assert view.render_line(0).text == row[:width]
+
+            view.scroll_to(x=7, animate=False)
+            await pilot.pause()
+            assert view.render_line(0).text == row[7 : 7 + width]
+            # Rows past the end render blank
+            assert view.render_line(3).text == " " * width
+
+    @pytest.mark.asyncio
+    async def test_invalid_markup_renders_literally(self):
+        """Test a row with broken markup (e.g. clamped mid-tag) is shown as plain text."""
+        async with LinesApp().run_test() as pilot:
+            view = pilot.app.query_one(DiffLines)
+            view.set_lines(["bad [/red] tag"], 14)
+            await pilot.pause()
+            assert view.render_line(0).text.startswith("bad [/red] tag")
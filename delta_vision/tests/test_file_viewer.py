@@ -0,0 +1,110 @@
+"""Tests for the file viewer screen.
+
+Covers the lazily rendered content panel, the keyword highlight toggle and its
+per-state cache, in-place refresh, and the optional Aho-Corasick matcher.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from textual.app import App
+
+from delta_vision.screens.file_viewer import FileViewerScreen
+
+
+def write(tmp_path: Path, name: str, content: str) -> str:
+    p = tmp_path / name
+    p.write_text(content, encoding="utf-8")
+    return str(p)
+
+
+class ViewerApp(App):
+    """Minimal app hosting a single file viewer."""
+
+    def __init__(self, viewer: FileViewerScreen):
+        super().__init__()
+        self.theme = 'textual-dark'
+        self._viewer = viewer
+
+    async def on_mount(self) -> None:
+        self.push_screen(self._viewer)
+
+
+async def settle(pilot):
+    """Let highlight workers finish and their results land on the event loop."""
+    await pilot.pause()
+    await pilot.app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+class TestFileViewerScreen:
+    """Test FileViewerScreen rendering, toggling and refresh."""
+
+    @pytest.fixture
+    def paths(self, tmp_path):
+        file_path = write(tmp_path, "out.txt", '20250101 "run"\nan error here\nplain line\n')
+        kw_path = write(tmp_path, "kw.md", "# Alerts (Red)\nerror\n")
+        return file_path, kw_path
+
+    @pytest.mark.asyncio
+    async def test_toggle_and_refresh(self, paths):
+        """Test Ctrl+K swaps highlighted and plain rows, and refresh reloads them."""
+        file_path, kw_path = paths
+        viewer = FileViewerScreen(file_path, keywords_path=kw_path, keywords_enabled=True)
+
+        with patch('delta_vision.screens.file_viewer.start_observer', return_value=(None, None)):
+            async with ViewerApp(viewer).run_test() as pilot:
+                await settle(pilot)
+                highlighted = viewer._content_view._lines
+                assert highlighted == ["   2│ an [u][red]error[/red][/u] here", "   3│ plain line"]
+
+                await pilot.press("ctrl+k")
+                await settle(pilot)
+                assert viewer._content_view._lines == ["   2│ an error here", "   3│ plain line"]
+
+                await pilot.press("ctrl+k")
+                await settle(pilot)
+                # Toggling back reuses the cached rendering
+                assert viewer._content_view._lines is highlighted
+
+                Path(file_path).write_text('20250101 "run"\nno error\nnew line\nerror\n', encoding="utf-8")
+                viewer.refresh_file()
+                await settle(pilot)
+                assert viewer._content_view._lines == [
+                    "   2│ no [u][red]error[/red][/u]",
+                    "   3│ new line",
+                    "   4│ [u][red]error[/red][/u]",
+                ]
+
+    def test_content_width_counts_cells(self, tmp_path):
+        """Test wide characters count double so the whole row can be scrolled into view."""
+        file_path = write(tmp_path, "wide.txt", '20250101 "run"\nab\n日本語テキスト\n')
+        viewer = FileViewerScreen(file_path)
+        viewer._load_file()
+        # 6-cell gutter plus 7 double-width characters
+        assert viewer._content_width == 6 + 14
+
+    def test_automaton_matches_regex(self, paths):
+        """Test the Aho-Corasick path produces exactly what the regex substitution does."""
+        pytest.importorskip("ahocorasick")
+        file_path, _ = paths
+        viewer = FileViewerScreen(file_path)
+        viewer.keywords_dict = {
+            "Alerts": ("Red", ["error", "error code", "code red"]),
+            "Net": ("Blue", ["tcp", "TCP/IP", "c"]),
+        }
+        viewer._build_keyword_caches()
+        assert viewer._kw_automaton is not None
+
+        lines = [
+            "error code red",  # overlapping keywords: the longest leftmost wins
+            "an error codes red",  # word-adjacent: 'codes' is not 'code'
+            "errors _error error_ error-code",
+            "tcp/ip over TCP, c and c++ and abc",
+            "",
+            "ERROR Code RED",
+        ]
+        for line in lines:
+            expected = viewer._kw_pattern.sub(viewer._wrap_keyword, line)
+            assert viewer._highlight_with_automaton(line) == expected
@@ -111,6 +111,28 @@ class TestKeywordHighlighter:
         assert "[u][red]virus[/red][/u]" in result
         assert "[u][blue]tcp[/blue][/u]" in result
 
+    def test_highlight_line_escapes_markup_around_keywords(self):
+        """Test that markup-like text next to keywords is still escaped."""
+        highlighter = KeywordHighlighter()
+        keywords_dict = {"Security": ("red", ["malware"])}
+        pattern, lookup = highlighter.get_pattern_and_lookup(keywords_dict)
+
+        plain = highlighter.highlight_line("malware found", pattern, lookup)
+        bracketed = highlighter.highlight_line("[bold]malware[/bold] found", pattern, lookup)
+
+        assert plain == "[u][red]malware[/red][/u] found"
+        assert bracketed == "\\[bold][u][red]malware[/red][/u]\\[/bold] found"
+
+    def test_highlight_line_keeps_backslash_before_keyword_literal(self):
+        """Test that a backslash right before a keyword does not escape the highlight tag."""
+        highlighter = KeywordHighlighter()
+        keywords_dict = {"Security": ("red", ["malware"])}
+        pattern, lookup = highlighter.get_pattern_and_lookup(keywords_dict)
+
+        result = highlighter.highlight_line("C:\\malware [x]", pattern, lookup)
+
+        assert result == "C:\\\\[u][red]malware[/red][/u] \\[x]"
+
     def test_highlight_with_color_lookup_basic(self):
         """Test color lookup highlighting method."""
         highlighter = KeywordHighlighter()
@@ -0,0 +1,102 @@
+"""Tests for server security configuration and connection limiting."""
+
+import asyncio
+
+import pytest
+
+from delta_vision.net.server_config import ConnectionLimiter
+
+
+class TestConnectionLimiter:
+    """Test the ConnectionLimiter class functionality."""
+
+    def test_add_and_remove_connection(self):
+        """Test that connections are tracked and released."""
+        limiter = ConnectionLimiter(max_connections=2)
+        assert limiter.add_connection("127.0.0.1:5000")
+        assert limiter.get_active_count() == 1
+
+        limiter.remove_connection("127.0.0.1:5000")
+        assert limiter.get_active_count() == 0
+
+    def test_duplicate_connection_rejected(self):
+        """Test that the same connection ID cannot be registered twice."""
+        limiter = ConnectionLimiter(max_connections=5)
+        assert limiter.add_connection("127.0.0.1:5000")
+        assert not limiter.add_connection("127.0.0.1:5000")
+        assert limiter.get_active_count() == 1
+
+    def test_limit_enforced(self):
+        """Test that connections beyond the limit are rejected."""
+        limiter = ConnectionLimiter(max_connections=1)
+        assert limiter.add_connection("a")
+        assert not limiter.can_accept_connection()
+        assert not limiter.add_connection("b")
+
+    def test_remove_unknown_connection_is_noop(self):
+        """Test that removing an untracked ID leaves the count unchanged."""
+        limiter = ConnectionLimiter(max_connections=2)
+        limiter.add_connection("a")
+        limiter.remove_connection("b")
+        assert limiter.get_active_count() == 1
+
+    def test_ids_stored_as_integer_keys(self):
+        """Test that tracked IDs are compact integer keys, not the raw strings."""
+        limiter = ConnectionLimiter(max_connections=2)
+        limiter.add_connection("10.0.0.1:443")
+        assert all(isinstance(key, int) for key in limiter._connection_ids)
+        assert "10.0.0.1:443" not in limiter._connection_ids
+
+    def test_reset_clears_tracking(self):
+        """Test that reset releases every tracked connection."""
+        limiter = ConnectionLimiter(max_connections=2)
+        limiter.add_connection("a")
+        limiter.add_connection("b")
+        limiter.reset()
+        assert limiter.get_active_count() == 0
+        assert limiter.add_connection("a")
+
+
+class TestConnectionLimiterAsync:
+    """Test the asyncio-native admission API."""
+
+    @pytest.mark.asyncio
+    async def test_async_add_and_remove(self):
+        """Test that async admission shares tracking with the sync API."""
+        limiter = ConnectionLimiter(max_connections=1)
+        assert await limiter.add_connection_async("a")
+        assert limiter.get_active_count() == 1
+        assert not await limiter.add_connection_async("b")
+
+        await limiter.remove_connection_async("a")
+        assert limiter.get_active_count() == 0
+        assert await limiter.add_connection_async("b")
+
+    @pytest.mark.asyncio
+    async def test_async_duplicate_releases_slot(self):
+        """Test that a rejected duplicate does not leak an admission slot."""
+        limiter = ConnectionLimiter(max_connections=2)
+        assert await limiter.add_connection_async("a")
+        assert not await limiter.add_connection_async("a")
+        assert await limiter.add_connection_async("b")
+
+    @pytest.mark.asyncio
+    async def test_async_waits_for_free_slot(self):
+        """Test that a waiting admission proceeds once a slot is released."""
+        limiter = ConnectionLimiter(max_connections=1)
+        assert await limiter.add_connection_async("a")
+
+        waiter = asyncio.ensure_future(limiter.add_connection_async("b", timeout=1.0))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await limiter.remove_connection_async("a")
+        assert await waiter
+        assert limiter.get_active_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_async_wait_times_out(self):
+        """Test that waiting for a slot gives up after the timeout."""
+        limiter = ConnectionLimiter(max_connections=1)
+        assert await limiter.add_connection_async("a")
+        assert not await limiter.add_connection_async("b", timeout=0.01)